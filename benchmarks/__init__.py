@@ -0,0 +1,9 @@
+"""Benchmark suite for ctwrap (airspeed velocity)
+
+Benchmarks are run from the repository root as::
+
+    $ asv run
+    $ asv compare v0.3.0 HEAD
+
+Results are stored in ``benchmarks/results``.
+"""
@@ -0,0 +1,74 @@
+"""Benchmarks for batch job overhead"""
+
+import contextlib
+import io
+
+import ctwrap as cw
+
+
+def _handler(tasks):
+    """Return handler running minimal module without delay"""
+    content = {
+        'ctwrap': '0.3.0',
+        'strategy': {'sequence': {'foo': [0.] * tasks}},
+        'defaults': {'foo': 0., 'bar': 1},
+    }
+    return cw.SimulationHandler.from_dict(content)
+
+
+class TimeOverhead:
+    """Per-task overhead of serial and parallel batch jobs"""
+
+    params = [100, 1000]
+    param_names = ['tasks']
+    timeout = 300
+
+    def setup(self, tasks):
+        self.sim = cw.Simulation.from_module(cw.modules.minimal)
+        self.sh = _handler(tasks)
+        with contextlib.redirect_stdout(io.StringIO()):
+            # start persistent worker pool
+            self.sh.run_parallel(self.sim, number_of_processes=2)
+
+    def teardown(self, tasks):
+        self.sh.close()
+
+    def time_run_serial(self, tasks):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.sh.run_serial(self.sim)
+
+    def time_run_parallel(self, tasks):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.sh.run_parallel(self.sim, number_of_processes=2)
+
+    def time_run_parallel_cold(self, tasks):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.sh.run_parallel(self.sim, number_of_processes=2)
+        self.sh.close()
+
+
+class TrackOverhead:
+    """Per-task overhead in seconds (tracked between releases)"""
+
+    unit = 'seconds'
+    tasks = 1000
+
+    def setup(self):
+        self.sim = cw.Simulation.from_module(cw.modules.minimal)
+        self.sh = _handler(self.tasks)
+
+    def teardown(self):
+        self.sh.close()
+
+    def _track(self, method, **kwargs):
+        from timeit import default_timer
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = default_timer()
+            method(self.sim, **kwargs)
+            return (default_timer() - start) / self.tasks
+
+    def track_serial(self):
+        return self._track(self.sh.run_serial)
+
+    def track_parallel(self):
+        return self._track(self.sh.run_parallel, number_of_processes=2)
@@ -0,0 +1,32 @@
+"""Benchmarks for start-up times (import in a fresh interpreter)"""
+
+
+class TimeImport:
+    """Import of ctwrap and loading of heavy dependencies on first use"""
+
+    timeout = 60
+
+    def timeraw_import(self):
+        return "import ctwrap"
+
+    def timeraw_import_handler(self):
+        # imports required by worker processes
+        return "import ctwrap.handler"
+
+    def timeraw_modules(self):
+        return "import ctwrap; dir(ctwrap.modules)"
+
+    def timeraw_parser(self):
+        # creates unit registry on first use
+        return """
+        import ctwrap as cw
+        cw.Parser({'T': '300. kelvin'}).T.m_as('kelvin')
+        """
+
+    def timeraw_output(self):
+        # imports pandas on first use
+        return """
+        import ctwrap as cw
+        out = cw.output.Output.from_dict({'format': 'csv', 'name': 'bench.csv'})
+        out.pack({'foo': 1.}, 'foo', errored=True)
+        """
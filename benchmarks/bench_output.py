@@ -0,0 +1,61 @@
+"""Benchmarks for file output"""
+
+import tempfile
+
+try:
+    import cantera as ct
+except ImportError:
+    ct = None
+
+from ctwrap.output import Output
+
+
+class _Save:
+    """Per-row cost of saving output as files grow"""
+
+    params = [0, 100, 1000]
+    param_names = ['rows']
+    _format = None
+
+    def setup(self, rows):
+        if ct is None:
+            raise NotImplementedError("Benchmark requires cantera")
+        self.gas = ct.Solution('h2o2.yaml')
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = Output.from_dict(
+            {'format': self._format, 'name': 'bench', 'force': True,
+             'returns': {'T': 'T', 'P': 'P', 'h': 'h'}},
+            file_path=self.tmp.name)
+        for i in range(rows):
+            self.out.save(self.data(i), 'init_{}'.format(i), {'foo': i})
+        self.count = 0
+
+    def teardown(self, rows):
+        self.out.close()
+        self.tmp.cleanup()
+
+    def data(self, i):
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
+    def time_save(self, rows):
+        self.count += 1
+        self.out.save(self.data(self.count), 'case_{}'.format(self.count), {'foo': self.count})
+
+
+class TimeSaveCSV(_Save):
+
+    _format = 'csv'
+
+    def data(self, i):
+        self.gas.TP = 300. + i, 101325.
+        return self.gas
+
+
+class TimeSaveHDF(_Save):
+
+    _format = 'h5'
+
+    def data(self, i):
+        arr = ct.SolutionArray(self.gas, 10)
+        arr.TP = 300. + i, 101325.
+        return arr
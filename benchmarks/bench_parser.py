@@ -0,0 +1,72 @@
+"""Benchmarks for parsing of parameters with units"""
+
+import ctwrap as cw
+from ctwrap.parser import _parse
+
+
+class TimeParser:
+    """Access of parameters via Parser objects"""
+
+    number = 100
+
+    def setup(self):
+        self.raw = {
+            'mechanism': 'gri30.yaml',
+            'state': {'T': '300. kelvin', 'P': '1. atmosphere', 'phi': .8},
+            'upstream': {'T': '500 K', 'P': '2. bar'},
+            'width': '30 mm',
+        }
+        self.parser = cw.Parser(self.raw)
+        self.state = self.parser.state
+        self.config = cw.Config(self.raw)
+
+    def time_construct(self):
+        cw.Parser(self.raw)
+
+    def time_getitem_string(self):
+        self.parser['mechanism']
+
+    def time_getitem_quantity(self):
+        self.parser['width']
+
+    def time_getitem_nested(self):
+        self.parser['state']
+
+    def time_m_as(self):
+        self.state.T.m_as('kelvin')
+
+    def time_parse(self):
+        _parse('1. atmosphere')
+
+    def time_compile(self):
+        cw.Config(self.raw)
+
+    def time_config_m_as(self):
+        self.config.state.T.m_as('kelvin')
+
+    def time_config_si(self):
+        self.config.state.si('T')
+
+    def time_from_yaml(self):
+        # module defaults are loaded for every task
+        cw.Parser.from_yaml('freeflame.yaml', defaults=True)
+
+
+class TimeUnits:
+    """Throughput of unit parsing"""
+
+    params = [100, 1000]
+    param_names = ['values']
+
+    def setup(self, values):
+        self.values = ['{} kelvin'.format(300 + i) for i in range(values)]
+        self.parser = cw.Parser({'T{}'.format(i): v for i, v in enumerate(self.values)})
+
+    def time_parse(self, values):
+        for val in self.values:
+            _parse(val)
+
+    def time_getitem(self, values):
+        parser = self.parser
+        for key in parser.raw:
+            parser[key].m_as('kelvin')
@@ -0,0 +1,74 @@
+"""Benchmarks for batch simulation strategies"""
+
+import ctwrap as cw
+
+
+def _matrix(cases):
+    """Return matrix strategy definition with the specified number of cases"""
+    # cases are distributed evenly among two entries
+    n = int(round(cases ** .5))
+    return {'matrix': {'foo': list(range(n)), 'bar': [.1 * i for i in range(n)]}}
+
+
+class TimeVariations:
+    """Generation of parameter variations"""
+
+    params = [10**3, 10**4, 10**5, 10**6]
+    param_names = ['cases']
+    timeout = 600
+
+    def setup(self, cases):
+        self.definition = _matrix(cases)
+
+    def time_load(self, cases):
+        cw.Strategy.load(self.definition)
+
+    def time_variations(self, cases):
+        for _ in cw.Strategy.load(self.definition).variations.values():
+            pass
+
+
+class TimeConfigurations:
+    """Generation of task configurations"""
+
+    params = [10**3, 10**4, 10**5, 10**6]
+    param_names = ['cases']
+    timeout = 1200
+
+    def setup(self, cases):
+        self.strategy = cw.Strategy.load(_matrix(cases))
+        self.defaults = {
+            'foo': 0, 'bar': 0.,
+            'state': {'T': '300. kelvin', 'P': '1. atmosphere'}}
+
+    def time_configurations(self, cases):
+        for _ in self.strategy.configurations(self.defaults).values():
+            pass
+
+    def peakmem_configurations(self, cases):
+        for _ in self.strategy.configurations(self.defaults).values():
+            pass
+
+    def time_overlays(self, cases):
+        configs = self.strategy.configurations(self.defaults)
+        for i in range(len(configs)):
+            configs.overlay(i).resolve()
+
+
+class TimeBase:
+    """Lookup of restart bases for all tasks"""
+
+    params = [10**3, 10**4, 10**5]
+    param_names = ['cases']
+    timeout = 600
+
+    def setup(self, cases):
+        self.definition = _matrix(cases)
+
+    def time_bases(self, cases):
+        cw.Strategy.load(self.definition).bases()
+
+    def time_base(self, cases):
+        strategy = cw.Strategy.load(self.definition)
+        for task in strategy.variations:
+            strategy.base(task)
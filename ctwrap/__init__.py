@@ -1,7 +1,7 @@
 """Package exports."""
 from .wrapper import Simulation
 from .handler import SimulationHandler
-from .parser import Parser
+from .parser import Parser, Config, Overlay
 from .strategy import Strategy, Sequence, Legacy, Matrix, Sobol
 from . import modules
 
@@ -0,0 +1,70 @@
+"""Deferred loading of heavy dependencies
+
+Importing ``ctwrap`` does not import ``pint``, ``pandas``, ``h5py`` or
+``cantera``; these are loaded on first use instead, which keeps start-up times
+of command line tools and worker processes short.
+"""
+
+import importlib
+from typing import Any, Callable, Optional
+
+
+class LazyObject:
+    """Proxy for an object that is created on first attribute access
+
+    Arguments:
+        factory: Callable returning the object
+    """
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        """Constructor"""
+        self.__dict__['_factory'] = factory
+        self.__dict__['_object'] = None
+
+    def _load(self) -> Any:
+        """Return object (created on first call)"""
+        if self._object is None:
+            self.__dict__['_object'] = self._factory()
+        return self._object
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return repr(self._load())
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __contains__(self, key):
+        return key in self._load()
+
+
+def module(name: str, message: Optional[str]=None) -> LazyObject:
+    """Import module on first attribute access
+
+    Arguments:
+        name: Module name
+        message: Error message raised if module cannot be imported
+
+    Returns:
+        Proxy for module
+    """
+    def factory():
+        try:
+            return importlib.import_module(name)
+        except ImportError as err:
+            if message is None:
+                raise
+            raise ImportError(message) from err
+
+    return LazyObject(factory)
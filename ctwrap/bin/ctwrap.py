@@ -6,6 +6,7 @@ import argparse
 import ctwrap
 from pathlib import Path
 import importlib
+import multiprocessing as mp
 
 import warnings
 warnings.filterwarnings(action='once')
@@ -42,6 +43,62 @@ parser_run.add_argument(
     help='run parallel calculations')
 parser_run.add_argument(
     '--strategy', default=None, help='batch job strategy')
+parser_run.add_argument(
+    '--resume', action='store_true', default=False,
+    help='skip tasks that were completed previously')
+parser_run.add_argument(
+    '--budget', type=float, default=None,
+    help='wall-clock budget in seconds (tasks are ordered by estimated cost)')
+parser_run.add_argument(
+    '--timeout', type=float, default=None,
+    help='wall-clock limit per task in seconds (parallel only)')
+parser_run.add_argument(
+    '--memory-limit', type=float, default=None,
+    help='address space limit per worker process in MB (parallel only; not with --broker)')
+parser_run.add_argument(
+    '--max-tasks', type=int, default=None,
+    help='number of tasks before worker processes are replaced (parallel only; not with --broker)')
+parser_run.add_argument(
+    '--chunk-size', type=int, default=None,
+    help='number of tasks sent to worker processes at once (parallel only; not with --broker; '
+    'adapts to task durations by default)')
+parser_run.add_argument(
+    '--profile', default=None, metavar='DIR',
+    help='save profiles of simulation tasks to directory (merged into batch.prof)')
+parser_run.add_argument(
+    '--profile-sample', type=float, default=None, metavar='FRACTION',
+    help='fraction of tasks that are profiled (default: all)')
+parser_run.add_argument(
+    '--cache', default=None, metavar='DIR',
+    help='reuse results of identical tasks saved in cache directory')
+parser_run.add_argument(
+    '--cache-size', type=float, default=None, metavar='MB',
+    help='size limit of result cache (least recently used results are removed)')
+parser_run.add_argument(
+    '--broker', default=None, metavar='HOST:PORT',
+    help='serve tasks to workers connecting via TCP (see ctwrap worker)')
+parser_run.add_argument(
+    '--authkey', default=None,
+    help='authentication key for workers connecting to broker (required with --broker)')
+
+parser_worker = subparsers.add_parser(
+    "worker", help='run worker processes connecting to a task broker',
+    description='Run worker processes connecting to a task broker')
+parser_worker.add_argument(
+    'address', metavar='HOST:PORT', help='address of task broker')
+parser_worker.add_argument(
+    '--authkey', required=True,
+    help='authentication key of task broker')
+parser_worker.add_argument(
+    '-n', '--processes', type=int, default=1, help='number of worker processes')
+parser_worker.add_argument(
+    '-v', '--verbosity', action='count', default=0, help='verbosity level')
+
+
+def _address(address):
+    """Convert HOST:PORT string to tuple"""
+    host, _, port = address.rpartition(':')
+    return host, int(port)
 
 
 def main():
@@ -56,6 +113,21 @@ def main():
             if not mod.startswith('__'):
                 print(' - {}'.format(mod))
         return
+    elif args.command == 'worker':
+        ctwrap.handler.run_worker(
+            _address(args.address), args.authkey, args.processes, args.verbosity)
+        return
+
+    if args.command == 'run' and args.broker:
+        if not args.authkey:
+            # remote workers cannot connect using the key of this process
+            parser_run.error('argument --authkey is required with --broker')
+        unsupported = [name for name in ['memory_limit', 'max_tasks', 'chunk_size']
+                       if getattr(args, name) is not None]
+        if unsupported:
+            # options of local worker pools
+            parser_run.error('argument --{} is not supported with --broker'.format(
+                unsupported[0].replace('_', '-')))
 
     module_name = args.module_name
 
@@ -107,10 +179,24 @@ def main():
                          "Run 'ctwrap run --help' to list available options.") from e
 
     # run parameter variation
-    if parallel:
-        sh.run_parallel(sim)
+    if args.broker:
+        # local workers are only started for parallel runs
+        processes = max(mp.cpu_count() // 2, 1) if parallel else 0
+        sh.run_distributed(sim, _address(args.broker), args.authkey,
+                           number_of_processes=processes, resume=args.resume,
+                           budget=args.budget, timeout=args.timeout,
+                           profile=args.profile, profile_sample=args.profile_sample,
+                           cache=args.cache, cache_size=args.cache_size)
+    elif parallel:
+        sh.run_parallel(sim, resume=args.resume, budget=args.budget,
+                        timeout=args.timeout, memory_limit=args.memory_limit,
+                        max_tasks=args.max_tasks, chunk_size=args.chunk_size,
+                        profile=args.profile, profile_sample=args.profile_sample,
+                        cache=args.cache, cache_size=args.cache_size)
     else:
-        sh.run_serial(sim)
+        sh.run_serial(sim, resume=args.resume, budget=args.budget,
+                      profile=args.profile, profile_sample=args.profile_sample,
+                      cache=args.cache, cache_size=args.cache_size)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,226 @@
+"""The :py:mod:`cache` module defines a :class:`ResultCache` object that
+stores results of simulation tasks across batch jobs.
+
+Usage
++++++
+
+Results are cached on disk, where keys are content-based, i.e. they combine
+the task configuration, the source of the simulation module, contents of
+mechanism files, output settings and the version of Cantera. Tasks that are
+unchanged are thus not recomputed, even if parameter variations are modified
+(e.g. after changing a default value or extending a sequence). A result cache
+is enabled when running a batch job:
+
+.. code-block:: Python
+
+   import ctwrap as cw
+
+   sim = cw.Simulation.from_module(cw.modules.ignition)
+   sh = cw.SimulationHandler.from_yaml('ignition.yaml')
+   sh.run_parallel(sim, cache='.ctwrap_cache', cache_size=1000) # size in MB
+
+Once the cache exceeds its size limit, results that were least recently used
+are removed.
+
+Class Definition
+++++++++++++++++
+"""
+
+from pathlib import Path
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import warnings
+
+from typing import Any, Dict, Optional
+
+
+#: Configuration entries referring to mechanism files
+mechanism_keys = ['mechanism']
+
+
+def _cantera():
+    """Import cantera (`None` if not installed)"""
+    try:
+        import cantera as ct
+    except ImportError:
+        return None
+    return ct
+
+
+def _mechanism_file(name: str) -> Optional[Path]:
+    """Locate mechanism file (local path or Cantera data directories)"""
+    path = Path(name)
+    if path.is_file():
+        return path
+    ct = _cantera()
+    if ct is None:
+        return None
+    for folder in ct.get_data_directories():
+        path = Path(folder) / name
+        if path.is_file():
+            return path
+    return None
+
+
+def _mechanisms(config: Any) -> Dict[str, Any]:
+    """Find mechanism entries in (nested) configuration"""
+    out = {}
+    if isinstance(config, dict):
+        for key, val in config.items():
+            if key in mechanism_keys and isinstance(val, str):
+                out[val] = None
+            else:
+                out.update(_mechanisms(val))
+    return out
+
+
+class ResultCache:
+    """Content-addressed cache of output records
+
+    Output records (see :meth:`Output.pack`) are pickled to files named by
+    the hash of their key. Access times are tracked using file modification
+    times, which are updated when records are loaded; the least recently
+    used records are removed once the cache exceeds its size limit. The cache
+    may be shared by several processes.
+
+    Arguments:
+        path: Cache directory
+        size: Size limit (MB); unlimited if `None`
+        salt: Additional content included in all keys (e.g. simulation module
+            source and output settings)
+    """
+
+    _ext = '.pkl'
+
+    def __init__(self, path: str, size: Optional[float]=None, salt: Optional[bytes]=None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.size = size
+        self._salt = hashlib.sha256(salt or b'')
+        ct = _cantera()
+        if ct is not None:
+            self._salt.update(ct.__version__.encode())
+        self._mechanisms = {}
+        self._used = sum(f.stat().st_size for f in self.path.glob('*' + self._ext))
+
+    def _hash_mechanism(self, name: str) -> str:
+        """Return hash of mechanism file contents (cached)"""
+        if name not in self._mechanisms:
+            path = _mechanism_file(name)
+            if path is None:
+                # mechanism is identified by name only
+                self._mechanisms[name] = name
+            else:
+                self._mechanisms[name] = hashlib.sha256(path.read_bytes()).hexdigest()
+        return self._mechanisms[name]
+
+    def key(self, config: Dict[str, Any], **kwargs: Any) -> str:
+        """Return key of a task
+
+        Arguments:
+            config: Task configuration
+            **kwargs: Additional content (e.g. parameter variation)
+
+        Returns:
+            Hexadecimal hash
+        """
+        content = {'config': config, 'extra': kwargs}
+        content['mechanisms'] = {name: self._hash_mechanism(name)
+                                 for name in sorted(_mechanisms(config))}
+        key = self._salt.copy()
+        key.update(json.dumps(content, sort_keys=True, default=str).encode())
+        return key.hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / (key + self._ext)
+
+    def __contains__(self, key: str) -> bool:
+        return self._file(key).is_file()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load cached record
+
+        Arguments:
+            key: Key of task
+
+        Returns:
+            Output record (`None` if not cached)
+        """
+        fname = self._file(key)
+        try:
+            with open(fname, 'rb') as stream:
+                record = pickle.load(stream)
+            # mark as recently used
+            os.utime(fname)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        return record
+
+    def put(self, key: str, record: Dict[str, Any]) -> bool:
+        """Save record
+
+        Arguments:
+            key: Key of task
+            record: Output record
+
+        Returns:
+            `True` if record was cached successfully
+        """
+        fname = self._file(key)
+        try:
+            # size of record that is replaced
+            previous = fname.stat().st_size
+        except OSError:
+            previous = 0
+
+        # write to temporary file first, as other processes may read
+        stream = tempfile.NamedTemporaryFile(dir=str(self.path), suffix='.tmp', delete=False)
+        try:
+            with stream:
+                pickle.dump(record, stream, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(stream.name)
+            os.replace(stream.name, str(fname))
+        except (OSError, pickle.PicklingError) as err:
+            if os.path.exists(stream.name):
+                os.unlink(stream.name)
+            # Convert exception to warning
+            msg = "Caching of result failed with error message:\n{}".format(err)
+            warnings.warn(msg, RuntimeWarning)
+            return False
+
+        self._used += size - previous
+        if self.size is not None and self._used > self.size * 2**20:
+            self.evict()
+        return True
+
+    def evict(self):
+        """Remove least recently used records exceeding the size limit"""
+        files = []
+        for fname in self.path.glob('*' + self._ext):
+            try:
+                stat = fname.stat()
+            except OSError:
+                # removed by other process
+                continue
+            files.append((stat.st_mtime, stat.st_size, fname))
+
+        self._used = sum(f[1] for f in files)
+        if self.size is None:
+            return
+        for _, size, fname in sorted(files):
+            if self._used <= self.size * 2**20:
+                break
+            try:
+                fname.unlink()
+            except OSError:
+                continue
+            self._used -= size
+
+    def clear(self):
+        """Remove all records"""
+        for fname in self.path.glob('*' + self._ext):
+            fname.unlink()
+        self._used = 0
@@ -44,6 +44,9 @@ Once loaded, tasks are passed to a :class:`Simulation` object wrapping ``my_test
 
    seq.run_serial(sim) # run all tasks in series
    seq.run_parallel(sim) # run all tasks as parallel processes
+   for task, variation, result in seq.as_completed(sim):
+       print(task, result['status']) # process results as tasks finish
+   seq.close() # shut down (persistent) worker processes
 
 Class Definition
 ++++++++++++++++
@@ -52,25 +55,38 @@ Class Definition
 from pathlib import Path
 import warnings
 import textwrap
+import time
+import json
+import heapq
+import weakref
+from collections import OrderedDict
+import cProfile
+import pstats
+import zlib
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, AsyncIterator, Callable, Container, Iterator, List, Optional, Set, Tuple, Union
 
 # multiprocessing
 import multiprocessing as mp
-from multiprocessing import queues as mpq
-from multiprocessing import synchronize as mps
-import queue  # imported for using queue.Empty exception
+from multiprocessing import connection as mpc
+from multiprocessing.managers import BaseManager
+import queue
+import threading
+import socket
+import sys
 
 try:
-    import ruamel_yaml as yaml
+    import resource
 except ImportError:
-    from ruamel import yaml
+    # not available on Windows
+    resource = None
 
 # ctwrap specific import
-from .parser import _parse, _write, Parser
+from .parser import _parse, _write, _load_yaml, Parser, Overlay
 from .strategy import Strategy, Sequence, Legacy, Matrix
 from .wrapper import Simulation
 from .output import Output
+from .cache import ResultCache
 
 
 indent1 = ' * '
@@ -84,6 +100,25 @@ class SimulationHandler(object):
     .. note:: :class:`SimulationHandler` objects should be instantiated
         using factory methods :meth:`from_yaml` or :meth:`from_dict`.
 
+    Batch runs accept the following options as keyword arguments, where
+    applicable:
+
+    * *timeout*: wall-clock limit per task (seconds); for distributed runs,
+      tasks that are not reported in time (e.g. due to lost workers) are
+      recorded as errored
+    * *memory_limit*: address space limit per worker process (MB)
+    * *max_tasks*: number of tasks before a worker process is replaced
+    * *chunk_size*: number of tasks sent to a worker process at once (adapts
+      to task durations if not specified)
+    * *profile*: directory for profiles of individual tasks (profiles are
+      merged into ``batch.prof``)
+    * *profile_sample*: fraction of tasks that are profiled
+    * *cache*: directory of result cache (see :class:`ResultCache`)
+    * *cache_size*: size limit of result cache (MB)
+
+    Remote workers of distributed runs require a shared file system for
+    profiles and result caches.
+
     Arguments:
        strategy: Batch simulation strategy
        defaults: Dictionary containing simulation defaults
@@ -103,15 +138,17 @@ class SimulationHandler(object):
         self._defaults = defaults
         self.verbosity = verbosity # type: int
 
+        # existing output is removed before the first task is run
+        self._clear = False
+        self._info = {}
         if output is not None:
             out = Output.from_dict(output)
-            if out.force:
-                dest = Path(out.output_name)
-                if dest.is_file():
-                    dest.unlink()
+            self._clear = out.force
             output = out.settings
 
         self._output = output
+        self._pool = None
+        self._finalizer = None
 
         self._variations = self._strategy.variations
         self._configurations = self._strategy.configurations(self._defaults)
@@ -125,7 +162,7 @@ class SimulationHandler(object):
         return {
             'defaults': self._defaults,
             'strategy': self._strategy.definition,
-            'cases': self._variations
+            'cases': dict(self._variations)
         }
 
     @classmethod
@@ -168,8 +205,7 @@ class SimulationHandler(object):
             raise IOError("Unable to locate YAML configuration file '{}'"
                           "".format(yaml_file))
 
-        with open(full_name) as stream:
-            content = yaml.load(stream, Loader=yaml.SafeLoader)
+        content = _load_yaml(full_name)
 
         output = content.get('output', {})
 
@@ -232,7 +268,7 @@ class SimulationHandler(object):
             yield task
 
     def __getitem__(self, task: str):
-        return self._variations(task)
+        return self._variations[task]
 
     def configuration(self, task: str):
         """
@@ -289,31 +325,91 @@ class SimulationHandler(object):
             warnings.warn("Keyword arguments are deprecated and ignored", DeprecationWarning)
 
         # create a new simulation object
+        start = time.perf_counter()
         obj = Simulation.from_module(sim._module)
+        info = {'worker': mp.current_process().name,
+                'load_time': time.perf_counter() - start}
 
         # run simulation
+        start = time.perf_counter()
         obj.run(self.configuration(task))
-        if self._output and obj.data:
-            out = Output.from_dict(self._output)
-            out.save(obj.data, entry=task, variation=self._variations[task])
+        info['wall_time'] = time.perf_counter() - start
+        info.update(obj.timing)
+
+        out = self._prepare_output()
+        if out and obj.data:
+            start = time.perf_counter()
+            record = out.pack(obj.data, entry=task, variation=self._variations[task])
+            info['output_time'] = time.perf_counter() - start
+            if record is not None:
+                if resource is not None:
+                    info['max_rss'] = _max_rss()
+                info['variation'] = self._variations[task]
+                record['info'] = info
+                out.write([record])
             out.finalize(self.metadata)
 
-    def _setup_batch(self, parallel: bool=False):
-        """Create batch queues used by worker function"""
+    def _prepare_output(self, resume: bool=False) -> Optional[Output]:
+        """Prepare output file and return output object"""
+        if self._output is None:
+            return None
 
-        if parallel:
-            tasks_to_accomplish = mp.Queue()
+        out = Output.from_dict(self._output)
+        if self._clear and not resume:
+            # retain information on previous runs
+            self._info = out.info()
+            out.clear()
+        self._clear = False
+        return out
+
+    def _setup_batch(self,
+                     sim: Simulation,
+                     resume: bool=False,
+                     budget: Optional[float]=None,
+                     workers: int=1) -> '_TaskGraph':
+        """Create dependency graph of batch jobs used by worker function"""
+        out = self._prepare_output(resume)
+        if out is not None:
+            info = {**self._info, **out.info()}
+            costs = _estimate_cost(self._variations, info)
         else:
-            tasks_to_accomplish = queue.Queue()
-        for task, config in self._configurations.items():
-            tasks_to_accomplish.put((task, config))
+            costs = None
+
+        completed = set()
+        if out is not None and resume:
+            # skip completed tasks; remove incomplete or errored entries
+            completed = set(out.completed())
+            out.remove(sorted((set(out.dir()) - completed) & self._configurations.keys()))
+            completed &= self._configurations.keys()
+            if self.verbosity > 0:
+                msg = indent1 + 'Resuming batch simulation: skipping {} of {} tasks'
+                print(msg.format(len(completed), len(self._configurations)))
+
+        restart = sim.has_restart and out is not None
+        bases = self._strategy.bases() if restart else {}
+
+        loader = out.record if restart else None
+        graph = _TaskGraph(self._configurations, bases, completed, loader,
+                           costs, budget, workers)
+        if graph.skipped:
+            msg = ("Wall-clock budget does not accommodate {} of {} tasks "
+                   "(estimated)".format(len(graph.skipped), len(self._configurations)))
+            warnings.warn(msg, RuntimeWarning)
+        return graph
 
-        return tasks_to_accomplish
+    def _report(self, graph: '_TaskGraph'):
+        """Report tasks that were not run as the budget was exceeded"""
+        if graph.expired:
+            msg = ("Wall-clock budget exceeded: {} tasks were not run (use "
+                   "'resume' to continue)".format(len(graph.expired)))
+            warnings.warn(msg, RuntimeWarning)
 
     def run_serial(self,
                    sim: Simulation,
                    verbosity: Optional[int]=None,
-                   **kwargs: str) -> bool:
+                   resume: Optional[bool]=False,
+                   budget: Optional[float]=None,
+                   **options: Any) -> bool:
         """
         Run variation in series.
 
@@ -328,15 +424,17 @@ class SimulationHandler(object):
         Arguments:
             sim: instance of :class:`Simulation` class
             verbosity: verbosity
-            **kwargs: dependent on implementation
+            resume: skip tasks that were completed previously
+            budget: wall-clock budget (seconds)
+            **options: options *profile*, *profile_sample*, *cache* and
+                *cache_size* (see :class:`SimulationHandler`)
 
         Returns:
             True when task is completed
         """
         assert isinstance(sim, Simulation), 'need simulation object'
 
-        if kwargs:
-            warnings.warn("Keyword arguments are deprecated and ignored", DeprecationWarning)
+        options = _batch_options(options, _RUNNER_OPTIONS, legacy=True)
 
         if verbosity is None:
             verbosity = self.verbosity
@@ -344,22 +442,32 @@ class SimulationHandler(object):
         if verbosity > 0:
             print(indent1 + 'Starting serial batch simulation')
 
-        # set up queues and dispatch worker
-        tasks_to_accomplish = self._setup_batch(parallel=False)
-        lock = None
-        _worker(sim._module, self._strategy.definition, self._output,
-                tasks_to_accomplish, lock, verbosity)
-
-        if self._output is not None:
-            out = Output.from_dict(self._output)
-            out.finalize(self.metadata)
+        _clear_profiles(options['profile'], self._configurations)
+        runner = _Runner(sim._module, self._strategy.definition, self._defaults,
+                         self._output, verbosity, **options)
+        writer = _Writer(self._output)
+        graph = self._setup_batch(sim, resume, budget)
+        while graph.ready:
+            # simulation modules defining 'run_batch' receive groups of jobs
+            jobs = [graph.pop(runner.name)[1:]]
+            while sim.has_batch and len(graph) and len(jobs) < _Runner.group_size:
+                jobs.append(graph.pop(runner.name)[1:])
+            for task, status, record, _ in runner.batch(jobs, time.time()):
+                graph.complete(task, status, record, runner.name)
+                writer.put(record)
+
+        writer.close(self.metadata)
+        _merge_profiles(options['profile'], self._configurations, verbosity)
+        self._report(graph)
         return True
 
     def run_parallel(self,
                      sim: Simulation,
                      number_of_processes: Optional[int]=None,
                      verbosity: Optional[int]=None,
-                     **kwargs: Optional[Any]) -> bool:
+                     resume: Optional[bool]=False,
+                     budget: Optional[float]=None,
+                     **options: Any) -> bool:
         """
         Run variation using multiprocessing.
 
@@ -368,27 +476,79 @@ class SimulationHandler(object):
         `python multiprocessing <https://docs.python.org/3/library/multiprocessing.html>`_.
         and also saves metadata.
 
+        Worker processes are persistent: each worker imports the simulation
+        module once, and remains available for successive calls of
+        :meth:`run_parallel` until :meth:`close` is called (or the handler
+        is garbage collected). Results of individual tasks are accessible
+        as they finish via :meth:`as_completed` or :meth:`run_async`.
+
         .. code-block:: Python
 
             # Runs all the variations in parallel
             sh.run_parallel(sim) # run
+            sh.close() # shut down worker processes
 
         Arguments:
             sim: instance of Simulation class
             number_of_processes: number of processes
             verbosity: verbosity level
-            **kwargs: dependent on implementation
+            resume: skip tasks that were completed previously
+            budget: wall-clock budget (seconds)
+            **options: batch options (see :class:`SimulationHandler`)
 
         Returns:
             True when task is completed
         """
         assert isinstance(sim, Simulation), 'need simulation object'
 
-        if kwargs:
-            warnings.warn("Keyword arguments are deprecated and ignored", DeprecationWarning)
+        options = _batch_options(options, _POOL_OPTIONS + _RUNNER_OPTIONS, legacy=True)
+        for _ in self.as_completed(sim, number_of_processes, verbosity,
+                                   resume=resume, budget=budget, **options):
+            pass
+
+        return True
+
+    def as_completed(self,
+                     sim: Simulation,
+                     number_of_processes: Optional[int]=None,
+                     verbosity: Optional[int]=None,
+                     resume: Optional[bool]=False,
+                     budget: Optional[float]=None,
+                     **options: Any
+        ) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """
+        Run variation using multiprocessing and yield tasks as they finish.
+
+        The :meth:`as_completed` method is the generator underlying
+        :meth:`run_parallel`: output is written as tasks are completed, and
+        metadata are saved once iteration is finished (or stopped early).
+
+        .. code-block:: Python
+
+            for task, variation, result in sh.as_completed(sim):
+                print(task, variation, result['status'])
+
+        Arguments:
+            sim: instance of Simulation class
+            number_of_processes: number of processes
+            verbosity: verbosity level
+            resume: skip tasks that were completed previously
+            budget: wall-clock budget (seconds)
+            **options: batch options (see :class:`SimulationHandler`)
+
+        Yields:
+            Tuple of task name, parameter variation and result, where the
+            result is a dictionary with entries *status* (``'done'`` or
+            ``'errored'``), *wall_time* and *record* (the output record of the
+            task, see :meth:`Output.pack`; `None` if there is no output)
+        """
+        assert isinstance(sim, Simulation), 'need simulation object'
+
+        options = _batch_options(options, _POOL_OPTIONS + _RUNNER_OPTIONS)
+        timeout, memory_limit, max_tasks, chunk_size = [options.pop(name) for name in _POOL_OPTIONS]
 
         if number_of_processes is None:
-            number_of_processes = mp.cpu_count() // 2
+            number_of_processes = max(mp.cpu_count() // 2, 1)
 
         if verbosity is None:
             verbosity = self.verbosity
@@ -397,121 +557,1116 @@ class SimulationHandler(object):
             print(indent1 + 'Starting parallel batch simulation using ' +
                   '{} cores'.format(number_of_processes))
 
-        # set up queues and lock
-        tasks_to_accomplish = self._setup_batch(parallel=True)
-        lock = mp.Lock()
+        # (re-)use pool of worker processes
+        key = (sim._module, number_of_processes, verbosity,
+               timeout, memory_limit, max_tasks, tuple(sorted(options.items())))
+        if self._pool is not None and self._pool.key != key:
+            self.close()
+        _clear_profiles(options['profile'], self._configurations)
+        if self._pool is None:
+            self._pool = _WorkerPool(
+                sim._module, self._strategy.definition, self._defaults, self._output,
+                number_of_processes, verbosity, timeout, memory_limit, max_tasks,
+                options)
+            self._finalizer = weakref.finalize(self, self._pool.close)
+
+        # results are saved by a single writer (this process)
+        writer = _Writer(self._output)
+        graph = self._setup_batch(sim, resume, budget, number_of_processes)
+        try:
+            for task, status, record, wall_time in self._pool.run(graph, chunk_size, sim.has_batch):
+                writer.put(record)
+                result = {'status': status, 'wall_time': wall_time, 'record': record}
+                yield task, self._variations[task], result
+
+        finally:
+            # save output of jobs that are still running
+            for _, _, record, _ in self._pool.drain():
+                writer.put(record)
+
+            if self._output is not None and verbosity > 1:
+                print(indent1 + "Appending metadata")
+            writer.close(self.metadata)
+            _merge_profiles(options['profile'], self._configurations, verbosity)
+            self._report(graph)
+
+    async def run_async(self,
+                        sim: Simulation,
+                        number_of_processes: Optional[int]=None,
+                        verbosity: Optional[int]=None,
+                        resume: Optional[bool]=False,
+                        budget: Optional[float]=None,
+                        **options: Any
+        ) -> AsyncIterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """
+        Asynchronous counterpart of :meth:`as_completed`.
+
+        Completed tasks are awaited in a dedicated background thread, so that
+        the event loop remains responsive while the batch is running. If the
+        iteration is cancelled, the batch is closed once a pending result is
+        received.
+
+        .. code-block:: Python
+
+            async for task, variation, result in sh.run_async(sim):
+                print(task, variation, result['status'])
+
+        Arguments:
+            sim: instance of Simulation class
+            number_of_processes: number of processes
+            verbosity: verbosity level
+            resume: skip tasks that were completed previously
+            budget: wall-clock budget (seconds)
+            **options: batch options (see :class:`SimulationHandler`)
+
+        Yields:
+            Tuple of task name, parameter variation and result (see
+            :meth:`as_completed`)
+        """
+        # only needed for asynchronous runs
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        loop = asyncio.get_running_loop()
+        results = self.as_completed(sim, number_of_processes, verbosity,
+                                    resume=resume, budget=budget, **options)
+        # generator is only advanced and closed by a single thread
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                item = await loop.run_in_executor(executor, next, results, None)
+                if item is None:
+                    break
+                yield item
+        finally:
+            await asyncio.shield(loop.run_in_executor(executor, results.close))
+            executor.shutdown(wait=False)
+
+    def run_distributed(self,
+                        sim: Simulation,
+                        address: Tuple[str, int]=('localhost', 50000),
+                        authkey: Optional[Union[str, bytes]]=None,
+                        number_of_processes: int=0,
+                        verbosity: Optional[int]=None,
+                        resume: Optional[bool]=False,
+                        budget: Optional[float]=None,
+                        **options: Any) -> bool:
+        """
+        Run variation using workers connected via TCP.
+
+        The :meth:`run_distributed` method starts a task broker that serves
+        jobs to worker processes, which may run on other nodes and connect via
+        ``ctwrap worker`` (see :func:`run_worker`). Results are collected
+        and written by this process.
+
+        .. code-block:: Python
+
+            # serve tasks on port 50000 of all interfaces (and run 4 local workers)
+            sh.run_distributed(sim, ('', 50000), authkey='secret', number_of_processes=4)
+
+        .. code-block::
+
+           $ ctwrap worker head-node:50000 --authkey secret --processes 32
+
+        Arguments:
+            sim: instance of Simulation class
+            address: host name and port of task broker (port 0 picks a free port);
+                by default, only connections from this node are accepted, while
+                an empty host name accepts connections on all interfaces
+            authkey: authentication key shared with workers; the default is the
+                random key of the current process, which only works for the
+                local workers started by this method (*number_of_processes*),
+                while workers started separately (e.g. ``ctwrap worker``)
+                require an explicit key
+            number_of_processes: number of local worker processes
+            verbosity: verbosity level
+            resume: skip tasks that were completed previously
+            budget: wall-clock budget (seconds)
+            **options: options *timeout*, *profile*, *profile_sample*, *cache*
+                and *cache_size* (see :class:`SimulationHandler`)
+
+        Returns:
+            True when task is completed
+        """
+        assert isinstance(sim, Simulation), 'need simulation object'
+
+        options = _batch_options(options, ('timeout',) + _RUNNER_OPTIONS)
+        timeout = options.pop('timeout')
+
+        if verbosity is None:
+            verbosity = self.verbosity
+
+        if isinstance(authkey, str):
+            authkey = authkey.encode()
+        elif authkey is None and not number_of_processes:
+            raise ValueError("Distributed runs without local workers require "
+                             "an explicit authentication key")
+        elif authkey is None:
+            authkey = bytes(mp.current_process().authkey)
+
+        # file-based modules are located via absolute path
+        module = sim._module
+        if Path(module).is_file():
+            module = str(Path(module).resolve())
+        _clear_profiles(options['profile'], self._configurations)
+        broker = _Broker((module, self._strategy.definition, self._defaults,
+                          self._output, options))
+
+        class _Server(_BrokerManager):
+            pass
+
+        _Server.register('broker', callable=lambda: broker)
+        server = _Server(address=tuple(address), authkey=authkey).get_server()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        if verbosity > 0:
+            print(indent1 + 'Serving tasks at {}:{}'.format(*server.address))
 
-        # creating processes
-        processes = []
+        workers = []
         for _ in range(number_of_processes):
             p = mp.Process(
-                target=_worker,
-                args=(sim._module, self._strategy.definition, self._output,
-                      tasks_to_accomplish, lock, verbosity))
+                target=run_worker,
+                args=(server.address, authkey, 1, verbosity))
             p.start()
-            processes.append(p)
-
-        # completing process
-        for p in processes:
-            p.join()
+            workers.append(p)
 
-        if self._output is not None:
-            if verbosity > 1:
+        writer = _Writer(self._output)
+        graph = self._setup_batch(sim, resume, budget, max(number_of_processes, 1))
+        out = Output.from_dict(self._output) if self._output else None
+        pending = {}
+        scanned = time.time()
+        try:
+            while graph.ready or pending:
+                while len(graph):
+                    task, ordinal, restart = graph.pop()
+                    broker.put_job((ordinal, restart))
+                    pending[ordinal] = task
+
+                # wait for a result and collect all results that are ready
+                results = []
+                try:
+                    results.append(broker.results.get(timeout=1.))
+                    while True:
+                        results.append(broker.results.get_nowait())
+                except queue.Empty:
+                    pass
+
+                now = time.time()
+                if timeout is not None and now - scanned >= 1.:
+                    # wall-clock limits apply once a job is picked up
+                    scanned = now
+                    msg = "Task exceeded timeout of {} seconds".format(timeout)
+                    for ordinal, start in list(broker.started.items()):
+                        if now - start > timeout and ordinal in pending:
+                            results.append(_aborted(out, self._variations, pending[ordinal],
+                                                    'TimeoutError', msg))
+
+                for result in results:
+                    ordinal = self._configurations.ordinal(result[0])
+                    if ordinal not in pending:
+                        # result arrived after task was aborted
+                        continue
+                    pending.pop(ordinal)
+                    broker.started.pop(ordinal, None)
+                    graph.complete(*result[:3])
+                    writer.put(result[2])
+
+        finally:
+            broker.closed.set()
+            for p in workers:
+                p.join(5)
+                if p.is_alive():
+                    # worker is stuck on an aborted task
+                    p.terminate()
+                    p.join()
+            server.stop_event.set()
+            server.listener.close()
+
+            if self._output is not None and verbosity > 1:
                 print(indent1 + "Appending metadata")
-            out = Output.from_dict(self._output)
-            out.finalize(self.metadata)
+            writer.close(self.metadata)
+            _merge_profiles(options['profile'], self._configurations, verbosity)
+            self._report(graph)
 
         return True
 
+    def close(self):
+        """Shut down worker processes used by :meth:`run_parallel`"""
+        if self._pool is not None:
+            self._finalizer.detach()
+            self._pool.close()
+        self._pool = None
+        self._finalizer = None
 
-def _worker(
-        module: str,
-        strategy: Dict[str, Any],
-        output: Dict[str, Any],
-        tasks_to_accomplish: mpq.Queue,
-        lock: mps.Lock,
-        verbosity: int
-    ) -> True:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+#: Options of :class:`_Runner` (hidden)
+_RUNNER_OPTIONS = ('profile', 'profile_sample', 'cache', 'cache_size')
+
+#: Options of :class:`_WorkerPool` (hidden)
+_POOL_OPTIONS = ('timeout', 'memory_limit', 'max_tasks', 'chunk_size')
+
+
+def _batch_options(
+        options: Dict[str, Any],
+        names: Tuple[str, ...],
+        legacy: bool=False
+    ) -> Dict[str, Any]:
+    """Validate options of batch runs and return them with defaults (hidden)
+
+    Arguments:
+        options: Keyword arguments passed to batch run
+        names: Names of applicable options
+        legacy: Whether other keyword arguments are ignored (deprecated)
+
+    Returns:
+        Dictionary of applicable options
     """
-    Worker function running simulation queues.
+    unknown = sorted(set(options) - set(names))
+    if unknown and legacy:
+        warnings.warn("Keyword arguments are deprecated and ignored", DeprecationWarning)
+    elif unknown:
+        raise TypeError("Unexpected keyword argument(s) '{}'".format("', '".join(unknown)))
+    return {name: options.get(name) for name in names}
+
+
+class _WorkerPool:
+    """Pool of persistent worker processes (hidden)
+
+    Each worker is connected to the parent process by a dedicated pipe; jobs
+    are only sent to idle workers, and workers are terminated by a sentinel
+    (`None`). Jobs are sent in chunks, where the chunk size adapts to
+    observed task durations unless specified (simulation modules defining
+    ``run_batch`` receive even shares of jobs). Workers exceeding the timeout
+    or terminating unexpectedly are replaced, where the corresponding task is
+    recorded as errored; workers are recycled after a maximum number of tasks.
+
+    Workers create configurations locally, i.e. jobs consist of task
+    ordinals and restart data.
 
     Arguments:
         module: Name of simulation module to be run
-        tasks_to_accomplish: Queue of remaining tasks
-        lock: Multiprocessing lock (used for parallel simulations only)
+        strategy: Batch simulation strategy definition
+        defaults: Dictionary containing simulation defaults
         output: Dictionary containing output information
+        number_of_processes: Number of worker processes
         verbosity: Verbosity level
+        timeout: Wall-clock limit per task (seconds)
+        memory_limit: Address space limit per worker (MB)
+        max_tasks: Number of tasks before a worker is replaced
+        options: Keyword arguments of :class:`_Runner` (profiling and
+            caching)
+    """
+
+    _chunk_time = .05 # target duration of chunks (seconds)
+    _chunk_max = 256 # maximum number of jobs per chunk
+
+    def __init__(self,
+                 module: str,
+                 strategy: Dict[str, Any],
+                 defaults: Dict[str, Any],
+                 output: Dict[str, Any],
+                 number_of_processes: int,
+                 verbosity: int,
+                 timeout: Optional[float]=None,
+                 memory_limit: Optional[float]=None,
+                 max_tasks: Optional[int]=None,
+                 options: Optional[Dict[str, Any]]=None):
+        options = options or {}
+        self.key = (module, number_of_processes, verbosity,
+                    timeout, memory_limit, max_tasks, tuple(sorted(options.items())))
+        self._args = (module, strategy, defaults, output)
+        self._options = options
+        self.verbosity = verbosity
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.max_tasks = max_tasks
+
+        # output of tasks that are aborted is saved by parent process
+        self._variations = Strategy.load(strategy).variations # pylint: disable=no-member
+        if isinstance(output, dict):
+            self._out = Output.from_dict(output)
+        else:
+            self._out = None
+
+        self._workers = {}
+        self._busy = {}
+        self._duration = None # moving average of task durations
+        for _ in range(number_of_processes):
+            self._spawn()
+
+    @property
+    def processes(self) -> List[mp.Process]:
+        """Worker processes"""
+        return [p for p, _ in self._workers.values()]
+
+    def _spawn(self) -> mpc.Connection:
+        """Start worker process and return connection"""
+        parent, child = mp.Pipe()
+        p = mp.Process(
+            target=_worker,
+            args=self._args + (child, self.verbosity, self.memory_limit, self._options))
+        p.start()
+        child.close()
+        self._workers[parent] = [p, 0]
+        return parent
+
+    def _retire(self, conn: mpc.Connection, kill: bool=False) -> mpc.Connection:
+        """Stop worker process and return connection of its replacement"""
+        p, _ = self._workers.pop(conn)
+        if kill:
+            p.terminate()
+        else:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        p.join()
+        conn.close()
+        return self._spawn()
+
+    def _failed(self, task: str, kind: str, msg: str) -> Tuple[str, str, Any, Any]:
+        """Create result of aborted task"""
+        return _aborted(self._out, self._variations, task, kind, msg)
+
+    def _collect(self) -> List[Tuple[mpc.Connection, Tuple[str, str, Any, Any]]]:
+        """Wait for busy workers and return results of finished tasks"""
+        timeout = None
+        if self.timeout is not None:
+            first = min(start for _, start in self._busy.values())
+            timeout = max(first + self.timeout - time.time(), 0)
+
+        out = []
+        finished = mpc.wait(list(self._busy), timeout)
+        for conn in finished:
+            tasks, start = self._busy.pop(conn)
+            try:
+                results = conn.recv()
+            except EOFError:
+                # worker died, e.g. due to memory limits
+                p = self._workers[conn][0]
+                p.join(1)
+                code = p.exitcode
+                conn = self._retire(conn, kill=True)
+                msg = "Worker process terminated unexpectedly (exit code {})".format(code)
+                out.extend((conn, self._failed(task, 'RuntimeError', msg)) for task in tasks)
+                continue
+
+            # update moving average of task durations (including overhead)
+            duration = (time.time() - start) / len(results)
+            if self._duration is None:
+                self._duration = duration
+            else:
+                self._duration = .8 * self._duration + .2 * duration
+
+            self._workers[conn][1] += len(results)
+            if self.max_tasks is not None and self._workers[conn][1] >= self.max_tasks:
+                conn = self._retire(conn)
+            out.extend((conn, result) for result in results)
+
+        if self.timeout is not None:
+            now = time.time()
+            for conn, (tasks, start) in list(self._busy.items()):
+                if now - start < self.timeout:
+                    continue
+                self._busy.pop(conn)
+                conn = self._retire(conn, kill=True)
+                msg = "Task exceeded timeout of {} seconds".format(self.timeout)
+                out.extend((conn, self._failed(task, 'TimeoutError', msg)) for task in tasks)
+
+        return out
+
+    def _chunk(self, graph: '_TaskGraph', chunk_size: Optional[int], batch: bool) -> int:
+        """Return number of jobs to be sent to an idle worker"""
+        if self.timeout is not None:
+            # timeouts apply to individual tasks
+            return 1
+        if chunk_size is not None:
+            return max(int(chunk_size), 1)
+
+        # jobs are shared among workers
+        share = -(-len(graph) // len(self._workers))
+        if batch:
+            # jobs are run jointly by simulation module
+            return max(min(share, _Runner.group_size), 1)
+        if self._duration is None:
+            return 1
+
+        # target duration of chunk
+        size = int(self._chunk_time / max(self._duration, 1e-6))
+        return max(min(size, share, self._chunk_max), 1)
+
+    def run(self, graph: '_TaskGraph', chunk_size: Optional[int]=None, batch: bool=False):
+        """Dispatch jobs to idle workers and yield completed tasks
+
+        Arguments:
+            graph: Dependency graph of batch jobs
+            chunk_size: Number of jobs sent to a worker at once (adaptive
+                if `None`)
+            batch: Whether the simulation module defines ``run_batch``
+
+        Yields:
+            Tuple of task name, status, output record and wall time
+        """
+        idle = list(self._workers)
+        while True:
+            # deadline is checked once per round (jobs may expire)
+            if not graph.ready and not self._busy:
+                break
+            while idle and len(graph):
+                conn = idle.pop()
+                size = min(self._chunk(graph, chunk_size, batch), len(graph))
+                jobs = [graph.pop(conn) for _ in range(size)]
+                now = time.time()
+                conn.send((now, [job[1:] for job in jobs]))
+                self._busy[conn] = ([job[0] for job in jobs], now)
+
+            for conn, result in self._collect():
+                if conn not in idle:
+                    idle.append(conn)
+                graph.complete(*result[:3], worker=conn)
+                yield result
+
+    def drain(self) -> List[Tuple[str, str, Any, Any]]:
+        """Wait for jobs that are still running and return their results
+
+        Jobs may be pending if :meth:`run` is not exhausted, e.g. if
+        iteration over completed tasks is stopped early.
+        """
+        out = []
+        while self._busy:
+            out.extend(result for _, result in self._collect())
+        return out
+
+    def close(self):
+        """Send sentinels and wait for workers to terminate"""
+        for conn in self._workers:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for conn, (p, _) in self._workers.items():
+            p.join()
+            conn.close()
+        self._workers = {}
+
+
+class _BrokerManager(BaseManager):
+    """Manager connecting remote workers to a task broker (hidden)"""
+
+
+_BrokerManager.register('broker')
+
+
+class _Broker:
+    """Task broker serving jobs to remote workers (hidden)
+
+    Methods are called by remote workers via proxies created by a
+    :class:`_BrokerManager`; jobs and results are exchanged using
+    thread-safe queues.
+
+    Arguments:
+        setup: Arguments needed to create a :class:`_Runner`
+    """
+
+    def __init__(self, setup: Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any],
+                                    Dict[str, Any]]):
+        self._setup = setup
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.started = {}
+        self.closed = threading.Event()
+
+    def setup(self) -> Tuple[str, Dict[str, Any], Dict[str, Any], Dict[str, Any],
+                             Dict[str, Any]]:
+        """Return simulation module, strategy definition, defaults, output
+        settings and options of :class:`_Runner`"""
+        return self._setup
+
+    def put_job(self, job: Tuple[int, Any]):
+        """Add job (task ordinal and restart data) to queue"""
+        self.jobs.put((time.time(), job))
+
+    def get_job(self, timeout: float=1.) -> Union[None, bool, Tuple[float, Tuple[int, Any]]]:
+        """Return time spent in queue and next job (`False` if no job is
+        available, `None` if closed)"""
+        if self.closed.is_set():
+            return None
+        try:
+            queued, job = self.jobs.get(timeout=timeout)
+        except queue.Empty:
+            return None if self.closed.is_set() else False
+        self.started[job[0]] = time.time()
+        return self.started[job[0]] - queued, job
+
+    def put_result(self, result: Tuple[str, str, Any, Any]):
+        """Report result of a job"""
+        self.results.put(result)
+
+
+def _aborted(
+        out: Optional[Output],
+        variations: Dict[str, Dict[str, Any]],
+        task: str,
+        kind: str,
+        msg: str
+    ) -> Tuple[str, str, Any, Any]:
+    """Create result of a task that was aborted (hidden)"""
+    msg = "Simulation of '{}' failed with error message:\n{}".format(task, msg)
+    warnings.warn(msg, RuntimeWarning)
+
+    record = None
+    if out is not None:
+        try:
+            record = out.pack({task: (kind, msg)}, entry=task,
+                              variation=variations[task], errored=True)
+        except Exception as err:
+            # Convert exception to warning
+            msg = "Output of entry '{}' failed with error message:\n{}".format(task, err)
+            warnings.warn(msg, RuntimeWarning)
+    return task, 'errored', record, None
+
+
+class _TaskGraph:
+    """Dependency graph of batch jobs (hidden)
+
+    Tasks that restart from a base case are released once the base case
+    is completed, where the output record of the base case is passed on as
+    restart data; independent tasks are available immediately. Tasks that
+    are ready are dispatched in order of the (estimated) cost of the
+    remaining restart chain, i.e. longest first. Tasks restarting from a base
+    case are preferably dispatched to the worker that ran the base case,
+    i.e. restart chains are kept on the same worker.
+
+    Arguments:
+        configurations: Task configurations (see :meth:`Strategy.configurations`)
+        bases: Dictionary mapping tasks to base cases used for restart
+        completed: Tasks completed previously (skipped)
+        loader: Function loading output records of previously completed tasks
+        costs: Estimated cost of tasks
+        budget: Wall-clock budget (seconds)
+        workers: Number of workers
+
+    Attributes:
+        skipped: Tasks that do not fit within the budget (estimated)
+        expired: Tasks that were not run as the budget was exceeded
+    """
+
+    def __init__(self,
+                 configurations: Dict[str, Dict[str, Any]],
+                 bases: Dict[str, str],
+                 completed: Optional[Set[str]]=None,
+                 loader: Optional[Callable[[str], Dict[str, Any]]]=None,
+                 costs: Optional[Dict[str, float]]=None,
+                 budget: Optional[float]=None,
+                 workers: int=1):
+        completed = completed or set()
+        costs = costs or {}
+        self._configurations = configurations
+        self._loader = loader
+        self._successors = {}
+        self._count = 0
+        self._ready = []
+        self._entries = {} # jobs that are ready (by task)
+        self._affine = {} # jobs restarting from tasks run by a worker
+        self.skipped = []
+        self.expired = []
+
+        roots = []
+        for task in configurations:
+            base = bases.get(task)
+            if task in completed:
+                continue
+            elif base is None:
+                roots.append((task, None))
+            elif base in completed:
+                # restart data are loaded from existing output
+                roots.append((task, base))
+            else:
+                self._successors.setdefault(base, []).append(task)
+
+        if budget is not None:
+            if costs:
+                roots = self._select(roots, costs, budget * workers)
+            self._deadline = time.time() + budget
+        else:
+            self._deadline = None
+
+        # cost of remaining restart chains
+        self._chain = {}
+        for task in configurations:
+            stack = [task]
+            while stack:
+                current = stack[-1]
+                pending = [s for s in self._successors.get(current, [])
+                           if s not in self._chain]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                stack.pop()
+                self._chain[current] = costs.get(current, 1.) + sum(
+                    self._chain[s] for s in self._successors.get(current, []))
+
+        for task, restart in roots:
+            self._push(task, restart)
+
+    def _select(self, roots, costs, capacity):
+        """Select tasks that fit within capacity (cheapest first)
+
+        Tasks without cost estimate are selected; they are limited by the
+        deadline only.
+        """
+        candidates = [(costs.get(task, 0.), task, restart) for task, restart in roots]
+        heapq.heapify(candidates)
+        selected = []
+        used = 0.
+        while candidates:
+            cost, task, restart = heapq.heappop(candidates)
+            if used + cost > capacity:
+                self.skipped.append(task)
+                self.skipped.extend(self._dependents(task))
+                continue
+            used += cost
+            if restart is None or isinstance(restart, str):
+                selected.append((task, restart))
+            for successor in self._successors.get(task, []):
+                heapq.heappush(candidates, (costs.get(successor, 0.), successor, 0))
+
+        # skipped tasks are not released
+        skipped = set(self.skipped)
+        self._successors = {
+            base: [task for task in tasks if task not in skipped]
+            for base, tasks in self._successors.items() if base not in skipped}
+        return selected
+
+    def _dependents(self, task):
+        """Return all tasks depending on task"""
+        out = []
+        stack = list(self._successors.get(task, []))
+        while stack:
+            task = stack.pop()
+            out.append(task)
+            stack.extend(self._successors.get(task, []))
+        return out
+
+    def _push(self, task, restart, worker=None):
+        """Add task to jobs that are ready"""
+        self._count += 1
+        entry = (-self._chain[task], self._count, task, restart)
+        heapq.heappush(self._ready, entry)
+        self._entries[task] = entry
+        if worker is not None:
+            self._affine.setdefault(worker, []).append(task)
+
+    def __len__(self) -> int:
+        """Number of jobs that are ready"""
+        return len(self._entries)
+
+    @property
+    def ready(self) -> bool:
+        """Check whether tasks are ready to be dispatched"""
+        if self._deadline is not None and self._entries and time.time() > self._deadline:
+            # wall-clock budget is exhausted
+            for task in self._entries:
+                self.expired.append(task)
+                self.expired.extend(self._dependents(task))
+            self._ready = []
+            self._entries = {}
+            self._affine = {}
+        return len(self._entries) > 0
+
+    def pop(self, worker: Optional[Any]=None) -> Tuple[str, int, Optional[Dict[str, Any]]]:
+        """Return next job, i.e. task, task ordinal and restart data
+
+        Arguments:
+            worker: Worker the job is dispatched to (used for restart chains)
+        """
+        entry = None
+        affine = self._affine.get(worker, [])
+        while affine and entry is None:
+            entry = self._entries.pop(affine.pop(), None)
+        while entry is None:
+            # jobs dispatched out of order remain in heap
+            item = heapq.heappop(self._ready)
+            if self._entries.get(item[2]) is item:
+                entry = self._entries.pop(item[2])
+
+        _, _, task, restart = entry
+        if isinstance(restart, str):
+            restart = self._loader(restart) if self._loader else None
+        return task, self._configurations.ordinal(task), restart
+
+    def complete(self, task: str, status: str, record: Optional[Dict[str, Any]],
+                 worker: Optional[Any]=None):
+        """Mark task as completed and release dependent tasks
+
+        Arguments:
+            task: Name of task
+            status: Status of task ('done' or 'errored')
+            record: Output record
+            worker: Worker that ran the task
+        """
+        if status != 'done':
+            record = None
+            worker = None
+        for successor in self._successors.pop(task, []):
+            self._push(successor, record, worker)
+
+
+def _estimate_cost(
+        variations: Dict[str, Dict[str, Any]],
+        info: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, float]:
+    """Estimate cost of tasks from wall times of previous runs (hidden)
+
+    Previous wall times are matched by parameter values. For new parameter
+    combinations, a multiplicative model based on mean wall times for
+    individual parameter values is used, where numeric values are
+    interpolated linearly.
+
+    Arguments:
+        variations: Parameter values grouped by task
+        info: Information on previously saved cases (see :meth:`Output.info`)
 
     Returns:
-        True when tasks are completed
+        Estimated cost grouped by task (`None` if there is no information)
     """
-    # pylint: disable=no-member
-
-    parallel = isinstance(lock, mp.synchronize.Lock)
-    if parallel:
-        this = mp.current_process().name
-    else:
-        this = 'main'
-
-    if verbosity > 1 and parallel:
-        print(indent2 + 'starting ' + this)
-
-    # create local copy of strategy object
-    strategy = Strategy.load(strategy)
-    variations = strategy.variations # pylint: disable=no-member
-    tasks = set(variations.keys())
-
-    # create local copy of output object
-    if isinstance(output, dict):
-        out = Output.from_dict(output)
-    else:
-        out = None
-
-    other = None
-    reschedule = 0
-    while reschedule < len(tasks):
+    samples = [(val['variation'], val['wall_time']) for val in info.values()
+               if isinstance(val.get('variation'), dict) and 'wall_time' in val]
+    if not samples:
+        return None
+
+    def _mean(values):
+        return sum(values) / len(values)
+
+    mean = _mean([wall for _, wall in samples])
+    exact = {}
+    effects = {}
+    for var, wall in samples:
+        exact.setdefault(json.dumps(var, sort_keys=True), []).append(wall)
+        for par, val in var.items():
+            effects.setdefault(par, {}).setdefault(json.dumps(val), []).append(wall)
+
+    costs = {}
+    for task, var in variations.items():
+        key = json.dumps(var, sort_keys=True)
+        if key in exact:
+            costs[task] = _mean(exact[key])
+            continue
+
+        cost = mean
+        for par, val in var.items():
+            walls = effects.get(par, {})
+            if json.dumps(val) in walls:
+                cost *= _mean(walls[json.dumps(val)]) / mean
+                continue
+            points = sorted((json.loads(k), _mean(v)) for k, v in walls.items()
+                            if isinstance(json.loads(k), (int, float)))
+            if not points or not isinstance(val, (int, float)):
+                continue
+            # piecewise linear interpolation (constant extrapolation)
+            if val <= points[0][0]:
+                value = points[0][1]
+            elif val >= points[-1][0]:
+                value = points[-1][1]
+            else:
+                for (x0, y0), (x1, y1) in zip(points[:-1], points[1:]):
+                    if x0 <= val <= x1:
+                        value = y0 + (y1 - y0) * (val - x0) / (x1 - x0)
+                        break
+            cost *= value / mean
+        costs[task] = cost
+
+    return costs
+
+
+class _Writer:
+    """Single writer saving output records (hidden)
+
+    Output records created by workers are buffered and written in batches;
+    metadata are appended once the batch is closed.
+
+    Arguments:
+        output: Dictionary containing output information
+        batch_size: Number of records written at once
+    """
+
+    def __init__(self, output: Optional[Dict[str, Any]], batch_size: int=16):
+        if isinstance(output, dict):
+            self.out = Output.from_dict(output)
+        else:
+            self.out = None
+        self.batch_size = batch_size
+        self._buffer = []
+
+    def put(self, record: Optional[Dict[str, Any]]):
+        """Add output record to buffer"""
+        if self.out is None or record is None:
+            return
+        self._buffer.append(record)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered output records"""
+        if not self._buffer:
+            return
+
         try:
-            # retrieve next simulation task
-            task, config = tasks_to_accomplish.get_nowait()
+            self.out.write(self._buffer)
+        except Exception as err:
+            # Convert exception to warning
+            msg = "Output of entries failed with error message:\n{}".format(err)
+            warnings.warn(msg, RuntimeWarning)
 
-        except queue.Empty:
-            # no tasks left
-            if verbosity > 1 and parallel:
-                print(indent2 + 'terminating ' + this)
-            break
+        self._buffer = []
+
+    def close(self, metadata: Dict[str, Any]):
+        """Write remaining output records and metadata"""
+        if self.out is None:
+            return
+        self.flush()
+        self.out.finalize(metadata)
+
+
+class _Runner:
+    """Callable running simulation tasks (hidden)
+
+    The simulation module is loaded once; results of the most recent task
+    are kept as template for loading restart data. For simulation modules
+    defining a ``restart`` method, recent results are cached in memory, so
+    that restart data are only loaded from output records if the base case
+    was run elsewhere (or was evicted from the cache). Groups of jobs are run
+    jointly if the simulation module defines a ``run_batch`` method.
+
+    Output records carry telemetry of tasks as entry ``info``: wall time,
+    time spent waiting for dispatch, loading the simulation module (first
+    task of a worker), parsing the configuration, solving and converting
+    output, as well as peak resident memory and the name of the worker.
+
+    If a profile directory is specified, simulation runs are profiled, and
+    statistics are saved as ``<task>.prof`` (joint runs of multiple tasks
+    are saved as ``<first task>-<last task>.prof``). If a result cache is
+    specified, output records of tasks that were run previously are loaded
+    from the cache (see :class:`ResultCache`), where restarted tasks also
+    depend on the configuration of their base case. As cached results do not
+    provide restart data, base cases are only loaded from the cache if all
+    tasks restarting from them are cached as well.
+
+    Arguments:
+        module: Name of simulation module to be run
+        strategy: Batch simulation strategy definition
+        defaults: Dictionary containing simulation defaults
+        output: Dictionary containing output information
+        verbosity: Verbosity level
+        name: Name of process
+        profile: Directory for profiles of individual tasks
+        profile_sample: Fraction of tasks that are profiled (selection is
+            based on task names, and is thus reproducible)
+        cache: Directory of result cache
+        cache_size: Size limit of result cache (MB)
+    """
+
+    group_size = 256 # maximum number of jobs run jointly
+    restart_size = 8 # maximum number of results kept in memory for restarts
 
+    def __init__(self,
+                 module: str,
+                 strategy: Dict[str, Any],
+                 defaults: Dict[str, Any],
+                 output: Dict[str, Any],
+                 verbosity: int,
+                 name: Optional[str]='main',
+                 profile: Optional[str]=None,
+                 profile_sample: Optional[float]=None,
+                 cache: Optional[str]=None,
+                 cache_size: Optional[float]=None):
+        self.verbosity = verbosity
+        self.name = name
+        self.profile = profile
+        self.profile_sample = profile_sample
+
+        # create local copies of simulation, strategy and output objects
+        start = time.perf_counter()
+        self.obj = Simulation.from_module(module)
+        self._load_time = time.perf_counter() - start
+        self.strategy = Strategy.load(strategy)
+        self.variations = self.strategy.variations # pylint: disable=no-member
+        self.configurations = self.strategy.configurations(defaults)
+        if isinstance(output, dict):
+            self.out = Output.from_dict(output)
+        else:
+            self.out = None
+        self.other = None
+        self._restarts = OrderedDict()
+        self._reusable = {}
+
+        self.cache = None
+        if cache is not None and self.out:
+            # results depend on simulation module and output settings
+            module = self.obj._load_module()
+            salt = Path(module.__file__).read_bytes()
+            settings = {'format': type(self.out).__name__, 'kwargs': self.out.kwargs}
+            salt += json.dumps(settings, sort_keys=True, default=str).encode()
+            self.cache = ResultCache(cache, cache_size, salt)
+
+    def _telemetry(self, queued: Optional[float]) -> Dict[str, Any]:
+        """Return telemetry available before a task is run"""
+        info = {'worker': self.name}
+        if queued is not None:
+            info['queue_time'] = max(time.time() - queued, 0.)
+
+        # module load time is attributed to the first task
+        info['load_time'] = self._load_time
+        self._load_time = 0.
+        return info
+
+    def job(self, ordinal: int, restart: Any=None) -> Tuple[str, Overlay, Any]:
+        """Return task, configuration (copy-on-write) and restart data of job"""
+        return self.configurations.label(ordinal), self.configurations.overlay(ordinal), restart
+
+    def _key(self, task: str, config: Union[Dict[str, Any], Overlay],
+             restart: Optional[Dict[str, Any]]) -> str:
+        """Return key of task in result cache"""
+        base = None
+        if restart is not None and self.obj.has_restart:
+            base = restart.get('entry')
+            if base in self.configurations:
+                base = self.configurations.overlay(self.configurations.ordinal(base)).resolve()
+        if isinstance(config, Overlay):
+            config = config.resolve()
+        return self.cache.key(config, variation=self.variations[task], restart=base)
+
+    def _cached(self, task: str, key: str,
+                queued: Optional[float]) -> Optional[Tuple[str, Dict[str, Any], Optional[float]]]:
+        """Return result of task from result cache (`None` if not cached)"""
+        if not self._reuse(task):
+            return None
+        record = self.cache.get(key)
+        if record is None:
+            return None
+
+        if self.verbosity > 0:
+            msg = indent1 + 'loading `{}` from cache ({})'
+            print(msg.format(task, self.name))
+
+        record = self.out.rename(record, task)
+        info = self._telemetry(queued)
+        wall_time = (record.get('info') or {}).get('wall_time')
+        if wall_time is not None:
+            info['wall_time'] = wall_time
+        info['cached'] = True
+        info['variation'] = self.variations[task]
+        record['info'] = info
+        return 'done', record, wall_time
+
+    def _reuse(self, task: str) -> bool:
+        """Check whether cached result of task can be used
+
+        Tasks restarting from a cached result need to be cached themselves,
+        as restart data are not available.
+        """
+        if not self.obj.has_restart:
+            return True
+
+        successors = self.strategy.successors() # pylint: disable=no-member
+        stack = [task]
+        while stack:
+            current = stack[-1]
+            pending = [s for s in successors.get(current, []) if s not in self._reusable]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            reuse = True
+            for successor in successors.get(current, []):
+                config = self.configurations.overlay(self.configurations.ordinal(successor))
+                key = self._key(successor, config, {'entry': current})
+                if not self._reusable[successor] or key not in self.cache:
+                    reuse = False
+                    break
+            self._reusable[current] = reuse
+
+        return self._reusable[task]
+
+    def _profiler(self, task: str) -> Optional[cProfile.Profile]:
+        """Return enabled profiler if task is profiled"""
+        if self.profile is None:
+            return None
+        if self.profile_sample is not None:
+            # map task name to [0, 1)
+            if zlib.crc32(task.encode()) / 2**32 >= self.profile_sample:
+                return None
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _dump(self, profiler: Optional[cProfile.Profile], name: str):
+        """Stop profiler and save statistics"""
+        if profiler is None:
+            return
+        profiler.disable()
         try:
-            # create object
-            obj = Simulation.from_module(module)
-
-            base = strategy.base(task)
-            restart = None
-            if obj.has_restart and out and base:
-                if parallel:
-                    with lock:
-                        done = set(out.dir())
-                        restart = out.load_like(base, other)
-                else:
-                    done = set(out.dir())
-                    restart = out.load_like(base, other)
-                invalid = done - tasks # empty if labels follow task names
-                if restart is None and not invalid:
-                    # need to pick another task
-                    if verbosity > 1:
-                        print(indent2 + 'rescheduling {} ({})'.format(task, this))
-                    tasks_to_accomplish.put((task, config))
-                    reschedule += 1
-                    continue
+            profiler.dump_stats(str(Path(self.profile) / '{}.prof'.format(name)))
+        except OSError as err:
+            # Convert exception to warning
+            msg = "Profile of '{}' could not be saved:\n{}".format(name, err)
+            warnings.warn(msg, RuntimeWarning)
+
+    def __call__(self, task: str, config: Union[Dict[str, Any], Overlay],
+                 restart: Optional[Dict[str, Any]]=None,
+                 queued: Optional[float]=None) -> Tuple[str, Optional[Dict[str, Any]], Optional[float]]:
+        """Run simulation task
+
+        Arguments:
+            task: Name of task
+            config: Configuration of task
+            restart: Output record of base case used for restart
+            queued: Time when the task was dispatched (seconds since epoch)
+
+        Returns:
+            Status of task ('done' or 'errored'), output record and wall time
+        """
+        key = None
+        if self.cache is not None:
+            key = self._key(task, config, restart)
+            result = self._cached(task, key, queued)
+            if result is not None:
+                return result
+
+        obj = self.obj
+        info = self._telemetry(queued)
+        wall_time = None
+        try:
+            if restart is not None and obj.has_restart and self.out:
+                # results kept in memory are modified by restart and thus removed
+                base = self._restarts.pop(restart.get('entry'), None)
+                restart = self.out.unpack(restart, self.other) if base is None else base
+                if restart is None:
+                    # result does not correspond to cache key
+                    key = None
+            else:
+                restart = None
 
-            if verbosity > 0:
+            if self.verbosity > 0:
                 msg = indent1 + 'running `{}` ({})'
-                print(msg.format(task, this))
+                print(msg.format(task, self.name))
 
             # run task
-            if restart is None:
-                obj.run(config)
-            else:
-                obj.restart(restart, config)
+            profiler = self._profiler(task)
+            start = time.perf_counter()
+            try:
+                if restart is None:
+                    obj.run(config)
+                else:
+                    obj.restart(restart, config)
+            finally:
+                self._dump(profiler, task)
+            wall_time = time.perf_counter() - start
 
             data = obj.data
             errored = False
@@ -524,14 +1679,288 @@ def _worker(
             data = {task: (type(err).__name__, str(err))}
             errored = True
 
-        # save output
-        if out and obj.data:
-            if parallel:
-                with lock:
-                    out.save(data, entry=task, variation=variations[task], errored=errored)
+        info.update(obj.timing)
+        if not obj.data:
+            data = None
+        return self._pack(task, data, errored, wall_time, info, key)
+
+    def _pack(self, task: str, data: Any, errored: bool, wall_time: Optional[float],
+              info: Dict[str, Any], key: Optional[str]=None) -> Tuple[str, Optional[Dict[str, Any]], Optional[float]]:
+        """Convert output for writer (and save to result cache)"""
+        record = None
+        if self.out and data:
+            try:
+                start = time.perf_counter()
+                record = self.out.pack(data, entry=task, variation=self.variations[task], errored=errored)
+                info['output_time'] = time.perf_counter() - start
+            except Exception as err:
+                # Convert exception to warning (worker remains available)
+                msg = "Output of entry '{}' failed with error message:\n{}".format(task, err)
+                warnings.warn(msg, RuntimeWarning)
+                errored = True
+
+            if not errored:
+                self.other = data
+                if self.obj.has_restart:
+                    self._restarts[task] = data
+                    while len(self._restarts) > self.restart_size:
+                        self._restarts.popitem(last=False)
+
+        if record is not None:
+            if wall_time is not None:
+                info['wall_time'] = wall_time
+            if resource is not None:
+                info['max_rss'] = _max_rss()
+            info['variation'] = self.variations[task]
+            record['info'] = info
+
+        if errored:
+            return 'errored', record, wall_time
+        if key is not None and record is not None:
+            self.cache.put(key, record)
+        return 'done', record, wall_time
+
+    def batch(self, jobs: List[Tuple[int, Any]],
+              queued: Optional[float]=None) -> List[Tuple[str, str, Any, Any]]:
+        """Run group of simulation tasks
+
+        If the simulation module defines ``run_batch``, jobs that do not
+        restart from other tasks are run jointly; if the joint run fails,
+        tasks are run individually.
+
+        Arguments:
+            jobs: List of jobs, i.e. task ordinal and restart data
+            queued: Time when jobs were dispatched (seconds since epoch)
+
+        Returns:
+            List of results, i.e. task, status, output record and wall time
+        """
+        jobs = [self.job(*job) for job in jobs]
+        group = []
+        if self.obj.has_batch and len(jobs) > 1:
+            group = [job for job in jobs if job[2] is None]
+
+        results = {}
+        keys = {}
+        if len(group) > 1 and self.cache is not None:
+            # only tasks that are not cached are run jointly
+            for task, config, _ in group:
+                keys[task] = self._key(task, config, None)
+                result = self._cached(task, keys[task], queued)
+                if result is not None:
+                    results[task] = result
+            group = [job for job in group if job[0] not in results]
+
+        if len(group) > 1:
+            tasks = [job[0] for job in group]
+            if self.verbosity > 0:
+                msg = indent1 + 'running `{}` ... `{}` ({} tasks; {})'
+                print(msg.format(tasks[0], tasks[-1], len(tasks), self.name))
+            info = self._telemetry(queued)
+            profiler = self._profiler(tasks[0])
+            try:
+                start = time.perf_counter()
+                try:
+                    data = self.obj.run_batch([job[1] for job in group])
+                finally:
+                    self._dump(profiler, '{}-{}'.format(tasks[0], tasks[-1]))
+                wall_time = (time.perf_counter() - start) / len(group)
+            except Exception as err:
+                # Convert exception to warning
+                msg = ("Batch simulation of '{}' failed with error message:\n{}\n"
+                       "Running tasks individually.".format(type(self.obj).__name__, err))
+                warnings.warn(msg, RuntimeWarning)
             else:
-                out.save(data, entry=task, variation=variations[task], errored=errored)
+                # timings of joint run are distributed evenly
+                info.update({k: v / len(group) for k, v in self.obj.timing.items()})
+                info['load_time'] /= len(group)
+                for task, val in zip(tasks, data):
+                    results[task] = self._pack(task, val, False, wall_time, dict(info),
+                                               keys.get(task))
+
+        return [(task,) + (results[task] if task in results else self(task, config, restart, queued))
+                for task, config, restart in jobs]
+
+
+def _profiles(path: Path, tasks: Container[str]) -> List[Path]:
+    """Return profiles of tasks, i.e. ``<task>.prof`` or ``<first>-<last>.prof``"""
+    out = []
+    for prof in sorted(path.glob('*.prof')):
+        name = prof.stem
+        if name in tasks or any(name[:i] in tasks and name[i + 1:] in tasks
+                                for i, char in enumerate(name) if char == '-'):
+            out.append(prof)
+    return out
+
+
+def _clear_profiles(profile: Optional[str], tasks: Container[str]):
+    """Create profile directory and remove profiles of previous runs
+
+    Only profiles named after tasks and ``batch.prof`` are removed.
+    """
+    if profile is None:
+        return
+    path = Path(profile)
+    path.mkdir(parents=True, exist_ok=True)
+    for prof in _profiles(path, tasks) + [path / 'batch.prof']:
+        if prof.is_file():
+            prof.unlink()
+
+
+def _merge_profiles(profile: Optional[str], tasks: Container[str],
+                    verbosity: int=0) -> Optional[Path]:
+    """Merge profiles of individual tasks into ``batch.prof``"""
+    if profile is None:
+        return None
+    path = Path(profile)
+    files = [str(prof) for prof in _profiles(path, tasks)]
+    if not files:
+        return None
+    merged = path / 'batch.prof'
+    pstats.Stats(*files).dump_stats(str(merged))
+    if verbosity > 0:
+        msg = indent1 + 'Merged {} profiles into `{}`'
+        print(msg.format(len(files), merged))
+    return merged
+
+
+def _max_rss() -> float:
+    """Return peak resident set size of current process (MB)"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        # reported in bytes
+        return rss / 2**20
+    # reported in kilobytes
+    return rss / 2**10
+
+
+def _worker(
+        module: str,
+        strategy: Dict[str, Any],
+        defaults: Dict[str, Any],
+        output: Dict[str, Any],
+        connection: mpc.Connection,
+        verbosity: int,
+        memory_limit: Optional[float]=None,
+        options: Optional[Dict[str, Any]]=None
+    ) -> True:
+    """
+    Worker function running simulation tasks received via pipe.
+
+    Output is not written by workers; output records are returned to the
+    parent process instead. Jobs consist of task ordinals and restart data,
+    i.e. configurations are created by the worker.
+
+    Arguments:
+        module: Name of simulation module to be run
+        strategy: Batch simulation strategy definition
+        defaults: Dictionary containing simulation defaults
+        output: Dictionary containing output information
+        connection: Connection to parent process
+        verbosity: Verbosity level
+        memory_limit: Address space limit (MB)
+        options: Keyword arguments of :class:`_Runner` (profiling and caching)
+
+    Returns:
+        True when tasks are completed
+    """
+    if memory_limit is not None:
+        if resource is None:
+            warnings.warn("Memory limits are not supported on this platform", RuntimeWarning)
+        else:
+            limit = int(memory_limit * 2**20)
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    runner = _Runner(module, strategy, defaults, output, verbosity,
+                     mp.current_process().name, **(options or {}))
+
+    if verbosity > 1:
+        print(indent2 + 'starting ' + runner.name)
+
+    while True:
+        try:
+            jobs = connection.recv()
+        except EOFError:
+            # parent process terminated
+            break
+        if jobs is None:
+            # sentinel: no tasks left
+            break
+
+        # jobs are received and reported in chunks
+        queued, jobs = jobs
+        connection.send(runner.batch(jobs, queued))
+
+    if verbosity > 1:
+        print(indent2 + 'terminating ' + runner.name)
+
+    connection.close()
+    return True
+
+
+def run_worker(
+        address: Tuple[str, int],
+        authkey: Union[str, bytes],
+        number_of_processes: int=1,
+        verbosity: int=0
+    ) -> True:
+    """
+    Run worker processes connected to a task broker.
+
+    Workers connect to the task broker started by
+    :meth:`SimulationHandler.run_distributed`, and run jobs until the broker
+    is closed. This function is used by the ``ctwrap worker`` command.
+
+    Arguments:
+        address: Host name and port of task broker
+        authkey: Authentication key of task broker
+        number_of_processes: Number of worker processes
+        verbosity: Verbosity level
+
+    Returns:
+        True when tasks are completed
+    """
+    if isinstance(authkey, str):
+        authkey = authkey.encode()
+
+    if number_of_processes > 1:
+        workers = []
+        for _ in range(number_of_processes):
+            p = mp.Process(target=run_worker, args=(address, authkey, 1, verbosity))
+            p.start()
+            workers.append(p)
+        for p in workers:
+            p.join()
+        return True
+
+    manager = _BrokerManager(address=tuple(address), authkey=authkey)
+    manager.connect()
+    broker = manager.broker()
+    name = '{}:{}'.format(socket.gethostname(), mp.current_process().name)
+    module, strategy, defaults, output, options = broker.setup()
+    runner = _Runner(module, strategy, defaults, output, verbosity, name, **options)
+
+    if verbosity > 1:
+        print(indent2 + 'starting ' + runner.name)
+
+    while True:
+        try:
+            job = broker.get_job()
+        except (EOFError, OSError):
+            # broker was shut down
+            break
+        if job is None:
+            break
+        elif job is False:
+            continue
+
+        # queue time is converted to local clock
+        waited, job = job
+        task, config, restart = runner.job(*job)
+        status, record, wall_time = runner(task, config, restart, time.time() - waited)
+        broker.put_result((task, status, record, wall_time))
 
-            other = obj.data
+    if verbosity > 1:
+        print(indent2 + 'terminating ' + runner.name)
 
     return True
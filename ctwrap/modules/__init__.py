@@ -1,5 +1,22 @@
-from . import equilibrium
-from . import freeflame
-from . import ignition
-from . import minimal
-from . import solution
+"""Pre-configured simulation modules (imported on first access)"""
+import importlib as _importlib
+import sys as _sys
+import types as _types
+
+__all__ = ['equilibrium', 'freeflame', 'ignition', 'minimal', 'solution']
+
+
+class _Modules(_types.ModuleType):
+    """Package importing simulation modules on first attribute access"""
+
+    def __getattr__(self, name):
+        if name in __all__:
+            return _importlib.import_module('.' + name, __name__)
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    def __dir__(self):
+        return sorted(set(__all__) | {k for k in self.__dict__ if k.startswith('__')})
+
+
+# importing simulation modules loads cantera, which is slow
+_sys.modules[__name__].__class__ = _Modules
@@ -31,10 +31,41 @@ def run(mechanism, state):
     Queried values are handled by the ``ctwrap``, where the YAML field
     ``output.returns`` specifies what values are written to file.
     """
+    obj = ct.Solution(mechanism)
+    _set_state(obj, state)
+
+    return obj
+
+
+def run_batch(configs):
+    """Function setting states of Cantera ``SolutionArray`` objects.
+
+    A single ``Solution`` object is created per mechanism, and states are
+    collected in a ``SolutionArray``; each configuration corresponds to
+    a single-entry slice.
+    """
+    out = [None] * len(configs)
+    groups = {}
+    for i, config in enumerate(configs):
+        groups.setdefault(config.mechanism, []).append(i)
+
+    for mechanism, index in groups.items():
+        obj = ct.Solution(mechanism)
+        arr = ct.SolutionArray(obj)
+        for i in index:
+            _set_state(obj, configs[i].state)
+            arr.append(obj.state)
+        for j, i in enumerate(index):
+            out[i] = arr[j:j + 1]
+
+    return out
+
+
+def _set_state(obj, state):
+    """Set state of Cantera ``Solution`` object"""
     T = state.T.m_as('kelvin')
     P = state.P.m_as('pascal')
 
-    obj = ct.Solution(mechanism)
     if all([key in state for key in ['fuel', 'oxidizer', 'phi']]) :
         obj.TP = T, P
         obj.set_equivalence_ratio(state.phi, state.fuel, state.oxidizer)
@@ -43,8 +74,6 @@ def run(mechanism, state):
     elif 'Y' in state:
         obj.TPY = T, P, state.Y
 
-    return obj
-
 
 if __name__ == "__main__":
     """ Main function """
@@ -6,23 +6,26 @@ Class Definitions
 +++++++++++++++++
 """
 
+from contextlib import contextmanager
 from pathlib import Path
-import pandas as pd
-import h5py
+import csv
+import io
 import json
+import math
+import os
+import tempfile
 import warnings
 
 from typing import Dict, List, Any, Optional, Union
 
-import pkg_resources
+from . import _lazy
+
+# heavy dependencies are imported on first use
+pd = _lazy.module('pandas')
+h5py = _lazy.module('h5py')
 
 # avoid explicit dependence on cantera
-try:
-    pkg_resources.get_distribution('cantera')
-except pkg_resources.DistributionNotFound:
-    ct = ImportError('Method requires a working cantera installation.')
-else:
-    import cantera as ct
+ct = _lazy.module('cantera', 'Method requires a working cantera installation.')
 
 
 class Output:
@@ -160,10 +163,104 @@ class Output:
         """
         raise NotImplementedError("Needs to be overloaded by derived methods")
 
+    def pack(
+            self,
+            data: Any,
+            entry: str,
+            variation: Optional[Dict]=None,
+            errored: Optional[bool]=False
+        ) -> Optional[Dict[str, Any]]:
+        """Convert output to a picklable record
+
+        Records are passed from worker processes to a single writer, which
+        saves them using :meth:`write`. Information on the simulation task
+        (e.g. wall time) may be added as dictionary entry ``info``.
+
+        Arguments:
+           data: Data to be saved
+           entry: Description of simulation task
+           variation: Parameter values
+           errored: Boolean describing success of simulation task
+
+        Returns:
+            Dictionary containing output record (`None` if there is nothing to save)
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
+    def rename(self, record: Dict[str, Any], entry: str) -> Dict[str, Any]:
+        """Return copy of output record saved under a different entry
+
+        Arguments:
+           record: Output record created by :meth:`pack`
+           entry: New label of entry
+
+        Returns:
+            Dictionary containing output record
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
+    def write(self, records: List[Dict[str, Any]]) -> bool:
+        """Write output records created by :meth:`pack`
+
+        Arguments:
+           records: List of output records
+
+        Returns:
+            `True` if data are saved successfully
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
     def dir(self) -> List[str]:
         """List previously saved cases"""
         raise NotImplementedError("Needs to be overloaded by derived methods")
 
+    def completed(self) -> List[str]:
+        """List previously saved cases that were completed successfully"""
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
+    def info(self) -> Dict[str, Dict[str, Any]]:
+        """Return information on previously saved cases
+
+        Information is passed as entry ``info`` of output records, and
+        contains entries such as wall time and parameter variation.
+
+        Returns:
+            Dictionary with information grouped by entry
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
+    def close(self):
+        """Close output file (if kept open between writes)"""
+        pass
+
+    def clear(self):
+        """Remove output file"""
+        dest = Path(self.output_name)
+        if dest.is_file():
+            dest.unlink()
+
+    def remove(self, entries: List[str]) -> bool:
+        """Remove previously saved cases
+
+        Arguments:
+           entries: Labels of entries to be removed
+
+        Returns:
+            `True` if entries are removed successfully
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
+    def record(self, entry: str) -> Optional[Dict[str, Any]]:
+        """Create output record from a previously saved case
+
+        Arguments:
+           entry: Label of entry
+
+        Returns:
+            Output record (`None` if entry does not exist)
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
     def load_like(self, entry: str, other: Any) -> Any:
         """Load previously saved output
 
@@ -173,6 +270,15 @@ class Output:
         """
         raise NotImplementedError("Needs to be overloaded by derived methods")
 
+    def unpack(self, record: Dict[str, Any], other: Any) -> Any:
+        """Load output from a record created by :meth:`pack`
+
+        Arguments:
+           record: Output record
+           other: Object of the same type as the one to be loaded
+        """
+        raise NotImplementedError("Needs to be overloaded by derived methods")
+
     def finalize(
             self,
             metadata: Dict[str, Any]
@@ -189,7 +295,12 @@ class Output:
 
 
 class WriteCSV(Output):
-    """Class writing CSV output"""
+    """Class writing CSV output
+
+    Rows are appended to the output file, which is kept open between writes;
+    the file is only rewritten if new columns are added. Labels of saved
+    entries are listed in an index file (extension ``.index``).
+    """
 
     _ext = ['.csv']
 
@@ -198,18 +309,26 @@ class WriteCSV(Output):
         if not data:
             return
 
+        return self.write([self.pack(data, entry, variation, errored)])
+
+    def pack(self, data, entry, variation=None, errored=False):
+        ""
+        if not data:
+            return None
+
         returns = self.kwargs.get('returns')
-        # key, value = next(iter(data.items()))
 
         if type(data).__name__ == 'Solution':
 
-            if isinstance(ct, ImportError):
-                raise ct # pylint: disable=raising-bad-type
-
             # use cantera native route to pandas.Series via SolutionArray.to_pandas
             arr = ct.SolutionArray(data, 1)
             data = arr.to_pandas(cols=list(returns.values())).iloc[0]
 
+        elif type(data).__name__ == 'SolutionArray' and data.shape == (1,):
+
+            # single entry (e.g. created by simulation module 'run_batch' method)
+            data = data.to_pandas(cols=list(returns.values())).iloc[0]
+
         elif type(data).__name__ == 'Mixture':
 
             # there is no native route in cantera
@@ -223,21 +342,133 @@ class WriteCSV(Output):
 
             data = pd.Series(dict(out))
 
-        if isinstance(data, pd.Series):
+        if not isinstance(data, pd.Series):
+            return None
+
+        if isinstance(variation, dict):
+            var = {k.replace('.', '_'): v for k, v in variation.items()}
+            data = pd.concat([pd.Series(var), data])
 
-            if isinstance(variation, dict):
-                var = {k.replace('.', '_'): v for k, v in variation.items()}
-                data = pd.concat([pd.Series(var), data])
+        row = pd.concat([pd.Series({'output': entry}), data])
+        return {'entry': entry, 'row': row}
 
-            row = pd.concat([pd.Series({'output': entry}), data])
+    def rename(self, record, entry):
+        ""
+        row = record['row'].copy()
+        row['output'] = entry
+        return {**record, 'entry': entry, 'row': row}
 
-            fname = Path(self.output_name)
-            if fname.is_file():
-                df = pd.read_csv(fname)
+    @property
+    def _sidecar(self):
+        """File containing information on saved cases"""
+        return Path(self.output_name).with_suffix('.jsonl')
+
+    @property
+    def _index(self):
+        """File containing labels of saved cases"""
+        return Path(self.output_name).with_suffix('.index')
+
+    def __getstate__(self):
+        # file handles are not shared
+        state = self.__dict__.copy()
+        state.pop('_stream', None)
+        state.pop('_columns', None)
+        return state
+
+    def _open(self):
+        """Open output file for appending rows (kept open between writes)"""
+        fname = Path(self.output_name)
+        stream = getattr(self, '_stream', None)
+        if stream is not None:
+            try:
+                if os.path.samestat(os.fstat(stream.fileno()), fname.stat()):
+                    return
+            except OSError:
+                pass
+            # file was removed or replaced
+            self.close()
+
+        columns = []
+        if fname.is_file():
+            with open(fname, newline='') as stream:
+                columns = next(csv.reader(stream), [])
+            if not self._index.is_file():
+                # file was not written by streaming writer
+                self._write_index()
+        elif self._index.is_file():
+            self._index.unlink()
+        self._stream = open(fname, 'a', newline='')
+        self._columns = columns
+
+    def close(self):
+        ""
+        stream = getattr(self, '_stream', None)
+        if stream is not None:
+            stream.close()
+        self._stream = None
+
+    def _rewrite(self, columns, exclude=None):
+        """Rewrite output file using new header and/or without some entries"""
+        fname = Path(self.output_name)
+        self.close()
+        tmp = fname.with_suffix('.tmp')
+        with open(fname, newline='') as src, open(tmp, 'w', newline='') as dest:
+            writer = csv.DictWriter(dest, columns)
+            writer.writeheader()
+            for row in csv.DictReader(src):
+                if exclude is None or row['output'] not in exclude:
+                    writer.writerow(row)
+        os.replace(str(tmp), str(fname))
+
+    @staticmethod
+    def _format(value):
+        """Format value for CSV output (missing values are empty)"""
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return ''
+        return value
+
+    def write(self, records):
+        ""
+        records = [rec for rec in records if rec]
+        if not records:
+            return False
+
+        self._open()
+        rows = [dict(rec['row'].items()) for rec in records]
+        columns = list(self._columns)
+        for row in rows:
+            # union of columns (e.g. for varying species of 'Mixture' objects)
+            columns.extend(key for key in row if key not in columns)
+        if columns != self._columns:
+            if self._columns:
+                self._rewrite(columns)
+                self._open()
             else:
-                df = pd.DataFrame(columns=row.keys())
-            df = df.append(row, ignore_index=True)
-            df.to_csv(fname, index=False)
+                csv.writer(self._stream).writerow(columns)
+            self._columns = columns
+
+        writer = csv.writer(self._stream)
+        writer.writerows([self._format(row.get(col)) for col in columns] for row in rows)
+        self._stream.flush()
+
+        # index is written after rows are saved
+        with open(self._index, 'a') as stream:
+            stream.write(''.join('{}\n'.format(rec['entry']) for rec in records))
+
+        lines = [json.dumps({'entry': rec['entry'], 'info': rec['info']})
+                 for rec in records if rec.get('info')]
+        if lines:
+            with open(self._sidecar, 'a') as stream:
+                stream.write('\n'.join(lines) + '\n')
+
+        return True
+
+    def _write_index(self):
+        """Create index from output file"""
+        with open(self.output_name, newline='') as stream:
+            labels = [row['output'] for row in csv.DictReader(stream)]
+        with open(self._index, 'w') as stream:
+            stream.write(''.join('{}\n'.format(label) for label in labels))
 
     def dir(self):
         ""
@@ -245,34 +476,108 @@ class WriteCSV(Output):
         if not fname.is_file():
             return []
 
-        df = pd.read_csv(fname)
-        return list(df.output)
+        if not self._index.is_file():
+            # file was not written by streaming writer
+            self._write_index()
+        with open(self._index) as stream:
+            return [line.rstrip('\n') for line in stream if line.strip()]
+
+    def completed(self):
+        ""
+        # rows are only written for successful simulations
+        return self.dir()
+
+    def info(self):
+        ""
+        if not self._sidecar.is_file():
+            return {}
+
+        out = {}
+        with open(self._sidecar) as stream:
+            for line in stream:
+                if line.strip():
+                    line = json.loads(line)
+                    out[line['entry']] = line['info']
+        return out
+
+    def clear(self):
+        ""
+        self.close()
+        super().clear()
+        for fname in [self._sidecar, self._index]:
+            if fname.is_file():
+                fname.unlink()
+
+    def remove(self, entries):
+        ""
+        fname = Path(self.output_name)
+        if not entries or not fname.is_file():
+            return False
+
+        with open(fname, newline='') as stream:
+            columns = next(csv.reader(stream), [])
+        exclude = set(entries)
+        self._rewrite(columns, exclude=exclude)
+        self._write_index()
+
+        if self._sidecar.is_file():
+            # information on removed entries is discarded
+            with open(self._sidecar) as stream:
+                lines = [line for line in stream
+                         if line.strip() and json.loads(line)['entry'] not in exclude]
+            tmp = self._sidecar.with_suffix('.tmp')
+            with open(tmp, 'w') as stream:
+                stream.write(''.join(lines))
+            os.replace(str(tmp), str(self._sidecar))
+        return True
+
+    def record(self, entry):
+        ""
+        return None
 
     def load_like(self, entry, other):
         ""
         raise NotImplementedError("Loader not implemented for '{}'".format(type(other).__name__))
 
+    def unpack(self, record, other):
+        ""
+        raise NotImplementedError("Loader not implemented for '{}'".format(type(other).__name__))
+
     def finalize(self, metadata):
         ""
         # don't save metadata
-        pass
+        self.close()
 
 
 class WriteHDF(Output):
-    """Class writing HDF output"""
+    """Class writing HDF output
+
+    The output file is kept open between writes of a batch and closed once
+    metadata are saved; labels of saved groups are tracked in memory.
+    """
 
     _ext = ['.h5', '.hdf', '.hdf5']
+    _marker = 'ctwrap_complete' # attribute marking completed entries
+    _info = 'ctwrap_info' # attribute holding information on entries
+    _hdf_kwargs = {'append', 'compression', 'compression_opts'}
+
+    def __init__(self, *args, **kwargs):
+        ""
+        super().__init__(*args, **kwargs)
+        # keyword arguments passed to writers of simulation data
+        self._write_kwargs = {k: v for k, v in self.kwargs.items() if k in self._hdf_kwargs}
+
+    def __getstate__(self):
+        # file handles are not shared
+        state = self.__dict__.copy()
+        state.pop('_hdf', None)
+        state.pop('_groups', None)
+        return state
 
     def save(self, data, entry, variation=None, errored=False):
         ""
         try:
-            if isinstance(data, dict):
-                for key, val in data.items():
-                    grp = '{}/{}'.format(entry, key)
-                    _save_hdf(val, self.settings, grp, variation,errored)
-            else:
-                _save_hdf(data, self.settings, entry, variation, errored)
-            return True
+            return self.write([self.pack(data, entry, variation, errored)])
 
         except OSError as err:
             # Convert exception to warning
@@ -280,8 +585,120 @@ class WriteHDF(Output):
             warnings.warn(msg, RuntimeWarning)
             return False
 
+    def pack(self, data, entry, variation=None, errored=False):
+        ""
+        # write data to a temporary file and return its binary image
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = Path(tmp) / self.name
+            if isinstance(data, dict):
+                for key, val in data.items():
+                    grp = '{}/{}'.format(entry, key)
+                    _save_hdf(val, fname, grp, variation, errored, **self._write_kwargs)
+            else:
+                _save_hdf(data, fname, entry, variation, errored, **self._write_kwargs)
+
+            if not fname.is_file():
+                return None
+
+            return {'entry': entry, 'data': fname.read_bytes(), 'errored': errored}
+
+    def rename(self, record, entry):
+        ""
+        if record['entry'] == entry:
+            return dict(record)
+
+        buffer = io.BytesIO()
+        with h5py.File(io.BytesIO(record['data']), 'r') as src:
+            with h5py.File(buffer, 'w') as dest:
+                src.copy(src[record['entry']], dest, entry)
+                for key, val in src.attrs.items():
+                    dest.attrs[key] = val
+
+        return {**record, 'entry': entry, 'data': buffer.getvalue()}
+
+    def _handle(self):
+        """Return handle of output file if kept open (`None` otherwise)"""
+        hdf = getattr(self, '_hdf', None)
+        if hdf is None:
+            return None
+
+        try:
+            if hdf.id.valid and os.path.samestat(
+                    os.fstat(hdf.id.get_vfd_handle()), os.stat(self.output_name)):
+                return hdf
+        except (OSError, ValueError):
+            pass
+
+        # file was closed, removed or replaced
+        self.close()
+        return None
+
+    def _open(self):
+        """Open output file for writing (kept open between writes)"""
+        hdf = self._handle()
+        if hdf is None:
+            hdf = h5py.File(self.output_name, 'a')
+            self._hdf = hdf
+            self._groups = set(hdf.keys())
+        return hdf
+
+    @contextmanager
+    def _access(self, mode='r'):
+        """Access output file (re-uses open handle)"""
+        hdf = self._handle()
+        if hdf is not None:
+            yield hdf
+        else:
+            with h5py.File(self.output_name, mode) as hdf:
+                yield hdf
+
+    def close(self):
+        ""
+        hdf = getattr(self, '_hdf', None)
+        if hdf is not None and hdf.id.valid:
+            hdf.close()
+        self._hdf = None
+        self._groups = None
+
+    def write(self, records):
+        ""
+        records = [rec for rec in records if rec]
+        if not records:
+            return False
+
+        existing = []
+        hdf = self._open()
+        for rec in records:
+            with h5py.File(io.BytesIO(rec['data']), 'r') as src:
+                for group in src.keys():
+                    if group in self._groups and not self.force:
+                        existing.append(group)
+                        continue
+                    elif group in self._groups:
+                        del hdf[group]
+                    src.copy(src[group], hdf, group)
+                    self._groups.add(group)
+                    if rec.get('info'):
+                        hdf[group].attrs[self._info] = json.dumps(rec['info'])
+                    if not rec.get('errored'):
+                        hdf[group].attrs[self._marker] = True
+                for key, val in src.attrs.items():
+                    if key not in hdf.attrs:
+                        hdf.attrs[key] = val
+        hdf.flush()
+
+        if existing:
+            msg = ('Cannot overwrite existing '
+                   'group(s) `{}` (use force to override)')
+            raise RuntimeError(msg.format('`, `'.join(existing)))
+
+        return True
+
     def dir(self):
         ""
+        if self._handle() is not None:
+            return sorted(self._groups)
+
         fname = Path(self.output_name)
         if not fname.is_file():
             return []
@@ -290,57 +707,90 @@ class WriteHDF(Output):
             keys = list(hdf.keys())
         return keys
 
-    def load_like(self, entry, other):
+    def completed(self):
         ""
-        if other is None:
-            return None
+        if not Path(self.output_name).is_file():
+            return []
 
-        fname = Path(self.output_name)
-        if not fname.is_file():
-            return None
+        with self._access() as hdf:
+            keys = [k for k, v in hdf.items() if v.attrs.get(self._marker, False)]
+        return keys
 
-        with h5py.File(fname, 'r') as hdf:
-            if entry not in hdf.keys():
-                return None
+    def info(self):
+        ""
+        if not Path(self.output_name).is_file():
+            return {}
+
+        with self._access() as hdf:
+            out = {k: json.loads(v.attrs[self._info])
+                   for k, v in hdf.items() if self._info in v.attrs}
+        return out
 
-        if type(other).__name__ == 'SolutionArray':
+    def clear(self):
+        ""
+        self.close()
+        super().clear()
+
+    def remove(self, entries):
+        ""
+        if not entries or not Path(self.output_name).is_file():
+            return False
 
-            if isinstance(ct, ImportError):
-                raise ct # pylint: disable=raising-bad-type
+        with self._access('a') as hdf:
+            for entry in entries:
+                if entry in hdf:
+                    del hdf[entry]
+        if self._handle() is not None:
+            self._groups.difference_update(entries)
+        return True
 
-            extra = list(other._extra.keys())
-            out = ct.SolutionArray(other._phase, extra=extra)
-            out.read_hdf(fname, group=entry)
-            return out
+    def record(self, entry):
+        ""
+        if not Path(self.output_name).is_file():
+            return None
 
-        elif type(other).__name__ == 'FreeFlame':
+        buffer = io.BytesIO()
+        with self._access() as hdf:
+            if entry not in hdf:
+                return None
+            with h5py.File(buffer, 'w') as dest:
+                hdf.copy(hdf[entry], dest, entry)
 
-            if isinstance(ct, ImportError):
-                raise ct # pylint: disable=raising-bad-type
+        return {'entry': entry, 'data': buffer.getvalue(), 'errored': False}
 
-            out = ct.FreeFlame(other.gas)
-            out.read_hdf(fname, group=entry)
-            return out
+    def load_like(self, entry, other):
+        ""
+        if other is None:
+            return None
 
-        raise NotImplementedError("Loader not implemented for '{}'".format(type(other).__name__))
+        # loaders may not share the open handle
+        self.close()
+        return _load_hdf(self.output_name, entry, other)
+
+    def unpack(self, record, other):
+        ""
+        if other is None or record is None:
+            return None
+
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = Path(tmp) / self.name
+            fname.write_bytes(record['data'])
+            return _load_hdf(fname, record['entry'], other)
 
     def finalize(self, metadata):
         ""
         if metadata is None:
+            self.close()
             return None
 
-        def _finalize(output_name, metadata):
-            """Hidden module"""
-
-            with h5py.File(output_name, 'r+') as hdf:
+        try:
+            # metadata are written once and the output file is closed
+            with self._access('r+') as hdf:
                 for key, val in metadata.items():
                     if isinstance(val, dict):
                         hdf.attrs[key] = json.dumps(val)
                     else:
                         hdf.attrs[key] = val
-
-        try:
-            _finalize(self.output_name, metadata)
             return True
 
         except OSError as err:
@@ -349,41 +799,14 @@ class WriteHDF(Output):
             warnings.warn(msg, RuntimeWarning)
             return False
 
+        finally:
+            self.close()
 
-def _save_hdf(data, settings, entry, variation, errored=False):
-    filename = settings.pop('name')
-    mode = settings.pop('mode', 'a')
-
-    if filename is None:
-        return
-
-    filepath = settings.pop('path')
-    force = settings.pop('force')
-    settings.pop('format')
-
-    if filepath is not None:
-        filename = Path(filepath) / filename
-
-    # file check
-    fexists = Path(filename).is_file()
-
-    if fexists:
-        with h5py.File(filename, 'r') as hdf:
-            for group in hdf.keys():
-                if group == entry and mode == 'a' and not force:
-                    msg = ('Cannot overwrite existing '
-                           'group `{}` (use force to override)')
-                    raise RuntimeError(msg.format(entry))
-                elif group == entry and mode == 'a' and force:
-                    mode = 'w'
-
-    settings.update(mode=mode)
-
-    hdf_kwargs = {'mode', 'append', 'compression', 'compression_opts'}
-    kwargs = {k: v for k, v in settings.items() if k in hdf_kwargs}
 
+def _save_hdf(data, filename, entry, variation, errored=False, **kwargs):
+    # data are written to new files; existing groups are handled by 'write'
     if errored:
-        with h5py.File(filename, mode) as hdf:
+        with h5py.File(filename, 'a') as hdf:
             grp = hdf.create_group(entry)
             grp.attrs[data[0]] = data[1]
     else:
@@ -393,11 +816,36 @@ def _save_hdf(data, settings, entry, variation, errored=False):
             else:
                 attrs = {}
             data.write_hdf(filename=filename, group=entry,
-                           attrs=attrs, **kwargs)
+                           attrs=attrs, mode='a', **kwargs)
         elif type(data).__name__ in ['FreeFlame']:
             if variation is not None:
                 description = '_'.join(['{}_{}'.format(k, v) for k, v in variation.items()])
             else:
                 description = None
             data.write_hdf(filename=filename, group=entry,
-                           description=description, **kwargs)
+                           description=description, mode='a', **kwargs)
+
+
+def _load_hdf(fname, entry, other):
+    fname = Path(fname)
+    if not fname.is_file():
+        return None
+
+    with h5py.File(fname, 'r') as hdf:
+        if entry not in hdf.keys():
+            return None
+
+    if type(other).__name__ == 'SolutionArray':
+
+        extra = list(other._extra.keys())
+        out = ct.SolutionArray(other._phase, extra=extra)
+        out.read_hdf(fname, group=entry)
+        return out
+
+    elif type(other).__name__ == 'FreeFlame':
+
+        out = ct.FreeFlame(other.gas)
+        out.read_hdf(fname, group=entry)
+        return out
+
+    raise NotImplementedError("Loader not implemented for '{}'".format(type(other).__name__))
@@ -41,6 +41,10 @@ If dimensions are defined, entries are accessible as ``pint.quantity`` objects:
    upstream.P.to('pascal') # returns "101325.0 pascal" (pint)
    upstream.P.m_as('pascal') # returns 101325.0 (float)
 
+Parsed values and unit conversion factors are cached, i.e. repeated access of
+the same entries (or of entries sharing value/unit strings) does not repeat the
+(comparatively slow) parsing of strings by ``pint``.
+
 If no dimensions are defined, entries are accessed as conventional dictionaries entries:
 
 .. code-block:: Python
@@ -58,13 +62,24 @@ Underlying dictionaries and/or data are accessed via the ``raw`` attribute, i.e.
    upstream.raw['P'] # equivalent
    upstream.raw['oxidizer'] # returns 'O2:1,AR:5' (str)
 
+Simulation modules receive configurations as :class:`Config` objects, i.e.
+immutable parsers where all entries are converted once, and magnitudes of
+quantities in SI base units are precomputed:
+
+.. code-block:: Python
+
+   config = Config(defaults) # compiled once
+   config.upstream.P # returns "1.0 standard_atmosphere" (pint)
+   config.upstream.si('P') # returns 101325.0 (float)
+
 Class Definition
 ++++++++++++++++
 """
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, KeysView, Generator, Union
+from typing import Optional, Dict, Any, List, Tuple, KeysView, Generator, Union
 from copy import deepcopy
-from pint import UnitRegistry
+from functools import lru_cache
+import os
 import warnings
 import re
 
@@ -73,11 +88,117 @@ try:
 except ImportError:
     from ruamel import yaml
 
+from . import _lazy
+
+
+__all__ = ['Parser', 'Config', 'Overlay']
+
+
+try:
+    class _SafeLoader(yaml.cyaml.CParser, yaml.constructor.SafeConstructor,
+                      yaml.resolver.VersionedResolver):
+        """C-accelerated loader that resolves values like ``SafeLoader``"""
+
+        def __init__(self, stream, version=None, preserve_quotes=None):
+            yaml.cyaml.CParser.__init__(self, stream)
+            self._parser = self._composer = self
+            yaml.constructor.SafeConstructor.__init__(self, loader=self)
+            yaml.resolver.VersionedResolver.__init__(self, version, loader=self)
+except AttributeError:
+    # C extension is not available
+    _SafeLoader = yaml.SafeLoader
+
+# parsed YAML files, keyed by path (see _load_yaml)
+_documents = {} # type: Dict[str, Tuple[Tuple[int, int], Any]]
+
+
+def _load_yaml(fname: Union[str, Path]) -> Any:
+    """Load YAML file
+
+    Parsed content is cached by file path, modification time and size, i.e.
+    files are only parsed again if they were changed.
+
+    Arguments:
+       fname: File name
+
+    Returns:
+       Content of YAML file (copy)
+    """
+    path = os.path.abspath(str(fname))
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _documents.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path) as stream:
+            cached = stamp, yaml.load(stream, Loader=_SafeLoader)
+        _documents[path] = cached
+    return deepcopy(cached[1])
+
+
+def _registry():
+    """Create unit registry (deferred until first use)"""
+    from pint import UnitRegistry
+    return UnitRegistry()
+
+
+#: Unit registry (``pint``) shared by all parsers; created on first use
+ureg = _lazy.LazyObject(_registry)
+
+# maximum number of cached value/unit strings and unit conversions
+_cache_size = 4096
+
+
+@lru_cache(maxsize=None)
+def _quantity_class():
+    """Return quantity class with cached conversion factors"""
+
+    class _Quantity(ureg.Quantity):
+        """Quantity with cached conversion factors for multiplicative units"""
+
+        def m_as(self, units):
+            ""
+            try:
+                factor = _factor(self._units, units)
+            except TypeError:
+                # unhashable units
+                factor = None
+            if factor is None:
+                return super().m_as(units)
+            return self._magnitude * factor
+
+    return _Quantity
+
+
+@lru_cache(maxsize=_cache_size)
+def _factor(source, target) -> Optional[float]:
+    """Conversion factor between units (`None` for non-multiplicative units)"""
+    source = ureg.Quantity(1., source)
+    if not (source._is_multiplicative and ureg.Quantity(1., target)._is_multiplicative):
+        return None
+    return source.m_as(target)
+
+
+@lru_cache(maxsize=_cache_size)
+def _base_factor(units) -> Optional[float]:
+    """Conversion factor to SI base units (`None` for non-multiplicative units)"""
+    unit = ureg.Quantity(1., units)
+    if not unit._is_multiplicative:
+        return None
+    return unit.to_base_units().magnitude
+
 
-__all__ = ['Parser']
+@lru_cache(maxsize=_cache_size)
+def _quantity(val: str) -> Tuple[Any, Any]:
+    """Parse string expression using ``pint`` (cached)
 
+    Arguments:
+       val: String expression
 
-ureg = UnitRegistry()
+    Returns:
+       `Tuple` containing magnitude and units container
+    """
+    out = ureg.Quantity(val)
+    return out.magnitude, out._units
 
 
 def _parse(val: str):
@@ -93,6 +214,12 @@ def _parse(val: str):
     if not isinstance(val, str):
         raise TypeError("Method requires string input")
 
+    return _split(val)
+
+
+@lru_cache(maxsize=_cache_size)
+def _split(val: str):
+    """Split string expression into value and unit (cached)"""
     value = re.findall(r'^([-+]?\d*\.\d*(?=\s)|\d+(?=\s))', val)
     if not (value and val[:len(value[0])] == value[0]):
         return val, None
@@ -128,6 +255,30 @@ def _write(value: Union[int, float, str], unit: Optional[str]=None):
     return out
 
 
+def _value(val: Any) -> Any:
+    """Convert entry that is not a dictionary
+
+    Arguments:
+       val: Raw entry
+
+    Returns:
+       Quantity if entry defines a unit, or original entry otherwise
+    """
+    if isinstance(val, str):
+        value, unit = _parse(val)
+        if value and unit:
+            # cached quantities are not shared, as they are mutable
+            return _quantity_class()(*_quantity(val))
+        return val
+
+    if isinstance(val, (list, tuple)) and len(val) == 3:
+        warnings.warn("Definition of values by lists/tuples is superseded by value/unit strings",
+                      PendingDeprecationWarning)
+        return ureg.Quantity(val[0], val[1])
+
+    return val
+
+
 def _update(value: Dict[str, Any], update: Dict[str, Any]):
     """Update entries in nested dictionaries (recursive)
 
@@ -146,6 +297,140 @@ def _update(value: Dict[str, Any], update: Dict[str, Any]):
     return value
 
 
+def _replace_value(old: Any, value: Any) -> Any:
+    """Return replacement of entry, where units of the original entry are retained
+
+    Arguments:
+       old: Original entry
+       value: New value
+
+    Returns:
+       Replacement entry
+    """
+    if isinstance(old, list):
+        return [value] + old[1:]
+    if isinstance(old, str):
+        _, unit = _parse(old)
+        return _write(value, unit)
+    return value
+
+
+def _has_entry(nested: Dict[str, Any], key_list: List[str]) -> bool:
+    """Check whether nested dictionary contains entry"""
+    for key in key_list:
+        if not isinstance(nested, dict) or key not in nested:
+            return False
+        nested = nested[key]
+    return True
+
+
+def _replace_copy(nested: Dict[str, Any], key_list: List[str], value: Any) -> Dict[str, Any]:
+    """Replace entry in nested dictionary (copy-on-write)
+
+    Only dictionaries along the path to the entry are copied; all other
+    entries are shared with the original.
+
+    Arguments:
+       nested: Multi-level (nested) dictionary
+       key_list: Sequence of keys leading to entry of interest
+       value: New value
+
+    Returns:
+       Updated (shallow) copy
+    """
+    out = dict(nested)
+    key = key_list[0]
+    if len(key_list) == 1:
+        out[key] = _replace_value(nested[key], value)
+    else:
+        out[key] = _replace_copy(nested[key], key_list[1:], value)
+    return out
+
+
+def _copy_mutable(value: Any) -> Any:
+    """Copy nested dictionaries, lists and other mutable values
+
+    Immutable scalars are shared with the original.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_mutable(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_copy_mutable(val) for val in value]
+    if value is None or isinstance(value, (str, bytes, bool, int, float)):
+        return value
+    return deepcopy(value)
+
+
+class Overlay(object):
+    """A copy-on-write configuration.
+
+    Configurations of tasks typically differ from default parameters in a few
+    entries only. An :class:`Overlay` shares (immutable) defaults, and stores
+    replaced values keyed by dotted paths, e.g. ``'upstream.phi'``, where units
+    of default entries are retained. Replacements of entries that are not
+    defined by defaults are ignored.
+
+    .. code-block:: Python
+
+       config = Overlay(defaults, {'upstream.phi': .8})
+       config.resolve()['upstream']['phi'] # returns 0.8
+
+    Arguments:
+        base: Default parameters (not modified)
+        delta: Dictionary of replaced values
+    """
+
+    __slots__ = ('base', 'delta')
+
+    def __init__(self, base: Dict[str, Any], delta: Optional[Dict[str, Any]]=None) -> None:
+        """Constructor"""
+        if isinstance(base, Overlay):
+            delta = {**base.delta, **(delta or {})}
+            base = base.base
+        if not isinstance(base, dict):
+            raise TypeError("Cannot construct 'Overlay' object from {} "
+                            "with type '{}'".format(base, type(base)))
+        self.base = base
+        self.delta = {key: val for key, val in (delta or {}).items()
+                      if _has_entry(base, key.split('.'))}
+
+    def __repr__(self):
+        return '<Overlay {}>'.format(self.delta)
+
+    def __eq__(self, other: 'Overlay'):
+        if isinstance(other, Overlay):
+            return self.resolve() == other.resolve()
+        return False
+
+    def __reduce__(self):
+        return (type(self), (self.base, self.delta))
+
+    def rebase(self, base: Dict[str, Any]) -> 'Overlay':
+        """Return overlay with the same replacements applied to other defaults
+
+        Arguments:
+           base: Default parameters
+
+        Returns:
+           New overlay
+        """
+        return Overlay(base, self.delta)
+
+    def resolve(self) -> Dict[str, Any]:
+        """Return configuration as nested dictionary
+
+        Dictionaries that do not contain replaced entries are shared with the
+        defaults, and must not be modified.
+
+        Returns:
+           Configuration
+        """
+        out = self.base
+        for key, val in self.delta.items():
+            out = _replace_copy(out, key.split('.'), val)
+        return out
+
+
 class Parser(object):
     """A lightweight class that handles units.
 
@@ -156,10 +441,14 @@ class Parser(object):
         raw: Dictionary to be parsed
     """
 
+    __slots__ = ('raw',)
+
     def __init__(self, raw: Dict[str, Any]) -> None:
         """Constructor"""
         if isinstance(raw, Parser):
             raw = deepcopy(raw.raw)
+        elif isinstance(raw, Overlay):
+            raw = deepcopy(raw.resolve())
         if not isinstance(raw, dict):
             raise TypeError("Cannot construct 'Parser' object from {} "
                             "with type '{}'".format(raw, type(raw)))
@@ -171,30 +460,22 @@ class Parser(object):
     def __getattr__(self, attr: str) -> str:
         """Make dictionary entries accessible as attributes"""
 
+        if attr == 'raw':
+            # not initialized (e.g. while unpickling)
+            raise AttributeError("'{}' object has no attribute 'raw'".format(type(self).__name__))
         if attr not in self.raw:
             raise AttributeError("unknown attribute '{}'".format(attr))
 
         return self[attr]
 
-    def __getitem__(self, key: str) -> Union[str, bool, int, float, ureg.Quantity]:
+    def __getitem__(self, key: str) -> Union[str, bool, int, float, 'pint.Quantity']:
         """Make class subscriptable"""
         val = self.raw[key]
 
-        if isinstance(val, str):
-            value, unit = _parse(val)
-            if value and unit:
-                return ureg.Quantity(val)
-            return val
-
         if isinstance(val, dict):
             return Parser(val)
 
-        if isinstance(val, (list, tuple)) and len(val) == 3:
-            warnings.warn("Definition of values by lists/tuples is superseded by value/unit strings",
-                          PendingDeprecationWarning)
-            return ureg.Quantity(val[0], val[1])
-
-        return val
+        return _value(val)
 
     def __len__(self):
         """Length corresponds to number of keys"""
@@ -254,11 +535,9 @@ class Parser(object):
             fname = Path(path) / fname
 
         try:
-            _ = fname.is_file() # will raise error
-            with open(fname) as stream:
-                out = yaml.load(stream, Loader=yaml.SafeLoader)
+            out = _load_yaml(fname)
         except OSError:
-            out = yaml.load(yml, Loader=yaml.SafeLoader)
+            out = yaml.load(yml, Loader=_SafeLoader)
 
         if keys is None:
             return cls(out)
@@ -285,8 +564,167 @@ class Parser(object):
         """
         if isinstance(new, Parser):
             new = new.raw
+        elif isinstance(new, Overlay):
+            new = deepcopy(new.resolve())
         elif not isinstance(new, dict):
             raise TypeError("Replacement value needs to be 'Parser' or 'dict', "
                             "not '{}".format(type(new)))
 
         self.raw = _update(self.raw, new)
+
+
+class Config(Parser):
+    """An immutable :class:`Parser` with pre-converted entries.
+
+    All entries are converted once when the object is created, i.e. nested
+    dictionaries are converted to :class:`Config` objects, and value/unit
+    strings to quantities, where magnitudes in SI base units are precomputed.
+    Access of entries thus does not involve parsing. Quantities are shared
+    between calls and should not be modified in place. Errors raised by the
+    conversion of an entry are deferred until the entry is accessed.
+
+    Arguments:
+        raw: Dictionary or Parser to be compiled
+    """
+
+    __slots__ = ('_raw', '_entries', '_errors', '_si')
+
+    def __init__(self, raw: Union[Dict[str, Any], Parser, Overlay]) -> None:
+        """Constructor"""
+        if isinstance(raw, Config):
+            raw = raw._raw
+        elif isinstance(raw, Parser):
+            raw = deepcopy(raw.raw)
+        elif isinstance(raw, Overlay):
+            # only immutable values are shared with defaults
+            raw = _copy_mutable(raw.resolve())
+        elif isinstance(raw, dict):
+            raw = deepcopy(raw)
+        else:
+            raise TypeError("Cannot construct 'Config' object from {} "
+                            "with type '{}'".format(raw, type(raw)))
+        self._compile(raw)
+
+    def _compile(self, raw: Dict[str, Any]):
+        """Convert entries (recursive)"""
+        entries = {}
+        errors = {}
+        si = {}
+        for key, val in raw.items():
+            if isinstance(val, dict):
+                sub = Config.__new__(Config)
+                sub._compile(val)
+                entries[key] = sub
+                continue
+            try:
+                entries[key] = _value(val)
+            except Exception as err:
+                errors[key] = err
+                continue
+            if entries[key] is not val:
+                # entry was converted to quantity
+                val = entries[key]
+                factor = _base_factor(val._units)
+                if factor is None:
+                    si[key] = val.to_base_units().magnitude
+                else:
+                    si[key] = val.magnitude * factor
+
+        object.__setattr__(self, '_raw', raw)
+        object.__setattr__(self, '_entries', entries)
+        object.__setattr__(self, '_errors', errors)
+        object.__setattr__(self, '_si', si)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("'Config' object is immutable")
+
+    def __reduce__(self):
+        return (Config, (self._raw,))
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Copy of underlying dictionary"""
+        return deepcopy(self._raw)
+
+    def __repr__(self):
+        return repr(self._raw)
+
+    def __getattr__(self, attr: str) -> Any:
+        ""
+        if attr.startswith('_'):
+            # not initialized (e.g. while unpickling)
+            raise AttributeError("'Config' object has no attribute '{}'".format(attr))
+        try:
+            return self[attr]
+        except KeyError:
+            raise AttributeError("unknown attribute '{}'".format(attr)) from None
+
+    def __getitem__(self, key: str) -> Any:
+        ""
+        try:
+            return self._entries[key]
+        except KeyError:
+            if key in self._errors:
+                raise self._errors[key] from None
+            raise
+
+    def __len__(self):
+        ""
+        return len(self._raw)
+
+    def __eq__(self, other: Parser):
+        ""
+        if isinstance(other, Config):
+            return self._raw == other._raw
+        if isinstance(other, Parser):
+            return self._raw == other.raw
+        return False
+
+    def __iter__(self) -> Generator:
+        ""
+        return iter(self._raw)
+
+    def __contains__(self, key: str) -> bool:
+        ""
+        return key in self._raw
+
+    def keys(self) -> KeysView[str]:
+        ""
+        return self._raw.keys()
+
+    def values(self):
+        ""
+        self._check()
+        return self._entries.values()
+
+    def items(self):
+        ""
+        self._check()
+        return self._entries.items()
+
+    def _check(self):
+        """Raise first deferred error"""
+        for err in self._errors.values():
+            raise err
+
+    def to_yaml(self):
+        ""
+        return yaml.dump(self._raw, Dumper=yaml.SafeDumper)
+
+    def update(self, new: Union[Dict, Parser]):
+        ""
+        raise TypeError("'Config' object is immutable")
+
+    def si(self, key: str) -> float:
+        """Return magnitude of quantity in SI base units
+
+        Arguments:
+           key: Name of entry
+
+        Returns:
+           Precomputed magnitude (e.g. in kelvin or pascal)
+        """
+        if key not in self._si:
+            self[key] # raise deferred error
+            raise KeyError("Entry '{}' is not a quantity".format(key))
+        return self._si[key]
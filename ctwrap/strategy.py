@@ -32,12 +32,17 @@ Class Definitions
 
 import warnings
 from copy import deepcopy
-from typing import Dict, Any, List, Optional
-import numpy as np
+from collections.abc import Mapping
+from functools import reduce
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from math import ceil, log10
+import operator
 import re
 
-from .parser import _parse, _write, Parser
+from . import _lazy
+from .parser import _replace_value, Parser, Overlay
+
+np = _lazy.module('numpy')
 
 
 def _replace_entry(nested, key_list, value):
@@ -53,13 +58,7 @@ def _replace_entry(nested, key_list, value):
 
     sub = nested[key_list[0]]
     if len(key_list) == 1:
-        if isinstance(sub, list):
-            sub[0] = value
-        elif isinstance(sub, str):
-            _, unit = _parse(sub)
-            sub = _write(value, unit)
-        else:
-            sub = value
+        sub = _replace_value(sub, value)
     else:
         sub = _replace_entry(sub, key_list[1:], value)
     nested[key_list[0]] = sub
@@ -112,6 +111,96 @@ def _sweep_matrix(tasks, defaults):
     return out
 
 
+class _Cases(Mapping):
+    """Lazy mapping of task labels to cases of a parameter variation (hidden)
+
+    Cases correspond to the cartesian product of values along all axes, where
+    the last axis varies fastest. Entries are created on demand, and are
+    accessible by label (e.g. ``'case_07'``) or ordinal; memory does not
+    scale with the number of cases.
+
+    Arguments:
+       axes: Dictionary of varied parameters and their values
+       defaults: Default parameters (if `None`, varied values are returned)
+    """
+
+    def __init__(self, axes: Dict[str, List[Any]], defaults: Optional[Dict[str, Any]]=None):
+        self._keys = list(axes.keys())
+        self._values = [list(val) for val in axes.values()]
+        self._defaults = defaults
+        self._size = reduce(operator.mul, [len(val) for val in self._values], 1)
+
+        # add leading zeros to labels to facilitate sorting
+        digits = ceil(log10(self._size)) # number of digits in tasks
+        self._template = "case_{{:0>{:d}d}}".format(digits)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.label(i) for i in range(self._size))
+
+    def __contains__(self, label: Any) -> bool:
+        try:
+            self.ordinal(label)
+        except KeyError:
+            return False
+        return True
+
+    def __getitem__(self, label: str) -> Dict[str, Any]:
+        return self.case(self.ordinal(label))
+
+    def __repr__(self) -> str:
+        return '<{} cases for {}>'.format(self._size, self._keys)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Number of values along each axis"""
+        return tuple(len(val) for val in self._values)
+
+    def label(self, ordinal: int) -> str:
+        """Return label of case with given ordinal"""
+        return self._template.format(ordinal)
+
+    def ordinal(self, label: str) -> int:
+        """Return ordinal of case with given label"""
+        try:
+            prefix, _, number = label.rpartition('_')
+            ordinal = int(number)
+        except (AttributeError, ValueError):
+            raise KeyError(label)
+        if prefix != 'case' or not 0 <= ordinal < self._size or self.label(ordinal) != label:
+            raise KeyError(label)
+        return ordinal
+
+    def index(self, ordinal: int) -> List[int]:
+        """Return indices of values along all axes"""
+        out = []
+        for values in reversed(self._values):
+            ordinal, i = divmod(ordinal, len(values))
+            out.append(i)
+        return out[::-1]
+
+    def variation(self, ordinal: int) -> Dict[str, Any]:
+        """Return varied values of case with given ordinal"""
+        values = [vals[i] for vals, i in zip(self._values, self.index(ordinal))]
+        return dict(zip(self._keys, values))
+
+    def overlay(self, ordinal: int) -> Overlay:
+        """Return case with given ordinal as copy-on-write configuration
+
+        Defaults are shared by all overlays, i.e. memory does not scale with
+        the size of the configuration.
+        """
+        return Overlay(self._defaults, self.variation(ordinal))
+
+    def case(self, ordinal: int) -> Dict[str, Any]:
+        """Return case with given ordinal"""
+        if self._defaults is None:
+            return self.variation(ordinal)
+        return deepcopy(self.overlay(ordinal).resolve())
+
+
 def _parse_mode(strat_val):
     """Parse the strategy values based on the mode specified
 
@@ -281,7 +370,8 @@ class Strategy:
            vars = strategy.variations
 
         Returns:
-           Nested dictionary of parameter values
+           Mapping of task labels to parameter values (entries are created
+           on demand)
         """
         raise NotImplementedError("Needs to be implemented by derived classes")
 
@@ -305,7 +395,8 @@ class Strategy:
            defaults: Dictionary containing default parameters
 
         Returns:
-           Nested dictionary of configurations
+           Mapping of task labels to configurations (entries are created
+           on demand)
         """
         raise NotImplementedError("Needs to be implemented by derived classes")
 
@@ -345,29 +436,66 @@ class Strategy:
         warnings.warn("Superseded by 'variations' and 'configurations'", DeprecationWarning)
         return dict(zip(self.variations.values(), self.configurations(defaults).values()))
 
-    def base(self, task: str):
-        """Return basis for a restart"""
-        nvars = len(self._definition)
-        if nvars < 2:
-            # only restart if more than one axis is defined
-            return None
+    def base(self, task: str, axis: int=-1) -> Optional[str]:
+        """Return basis for a restart
 
-        base = None
-        vars = self.variations
-        for key in vars:
-            if key == task:
-                break
-            base = key
+        A base case precedes the task along the restart axis, while values
+        along all other axes are identical.
 
-        # a base case only differ on the last axis
-        pars = list(vars[task].keys())
-        for par in pars[:-1]:
-            if base is None:
-                break
-            if vars[base][par] != vars[task][par]:
-                base = None
+        Arguments:
+           task: Name of task
+           axis: Restart axis (default: last axis)
+
+        Returns:
+           Name of base case (`None` if there is no base case)
+        """
+        return self._restarts(axis)[0].get(task)
+
+    def bases(self, axis: int=-1) -> Dict[str, str]:
+        """Return base cases for all tasks that are restarted
+
+        Arguments:
+           axis: Restart axis (default: last axis)
+
+        Returns:
+           Dictionary mapping tasks to base cases
+        """
+        return self._restarts(axis)[0]
+
+    def successors(self, axis: int=-1) -> Dict[str, List[str]]:
+        """Return tasks that are restarted from other tasks
+
+        Arguments:
+           axis: Restart axis (default: last axis)
+
+        Returns:
+           Dictionary mapping base cases to tasks
+        """
+        return self._restarts(axis)[1]
+
+    def _restarts(self, axis: int) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """Create index of base cases and successors (cached)"""
+        cases = self.variations
+        shape = cases.shape
+        axis = range(len(shape))[axis]
+        if axis in self._restart_index:
+            return self._restart_index[axis]
+
+        bases = {}
+        successors = {}
+        if len(shape) > 1:
+            # only restart if more than one axis is defined
+            stride = reduce(operator.mul, shape[axis + 1:], 1)
+            for ordinal in range(len(cases)):
+                if (ordinal // stride) % shape[axis] == 0:
+                    continue
+                task = cases.label(ordinal)
+                base = cases.label(ordinal - stride)
+                bases[task] = base
+                successors[base] = [task]
 
-        return base
+        self._restart_index[axis] = bases, successors
+        return bases, successors
 
 
 class Sequence(Strategy):
@@ -386,6 +514,8 @@ class Sequence(Strategy):
     def __init__(self, sweep: Dict[str, Any], name: Optional[str]=None):
         self._definition = sweep
         self.sweep = self._check_input(sweep, 1)
+        self._variations = None
+        self._restart_index = {}
         if name is None:
             name = type(self).__name__.lower()
         self.name = name
@@ -398,11 +528,13 @@ class Sequence(Strategy):
     @property
     def variations(self):
         ""
-        return self._label(_task_list(self.sweep))
+        if self._variations is None:
+            self._variations = _Cases(self.sweep)
+        return self._variations
 
     def configurations(self, defaults):
         ""
-        return self._label(_sweep_matrix(self.sweep, defaults))
+        return _Cases(self.sweep, defaults)
 
 
 class Legacy(Sequence):
@@ -430,6 +562,8 @@ class Matrix(Strategy):
     def __init__(self, matrix: Dict[str, Any], name: Optional[str]=None):
         self._definition = matrix
         self.matrix = self._check_input(matrix, 2, False)
+        self._variations = None
+        self._restart_index = {}
         if name is None:
             name = type(self).__name__.lower()
         self.name = name
@@ -442,11 +576,13 @@ class Matrix(Strategy):
     @property
     def variations(self):
         ""
-        return self._label(_task_list(self.matrix))
+        if self._variations is None:
+            self._variations = _Cases(self.matrix)
+        return self._variations
 
     def configurations(self, defaults):
         ""
-        return self._label(_sweep_matrix(self.matrix, defaults))
+        return _Cases(self.matrix, defaults)
 
 
 class Sobol(Strategy):
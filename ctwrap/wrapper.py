@@ -26,6 +26,11 @@ is loaded as:
 
    sim = cw.Simulation.from_module('my_test.py')
 
+Simulation modules may also define ``restart`` (restart from results of
+another task) and ``run_batch`` (joint evaluation of several configurations).
+Configurations are passed to simulation modules as immutable :any:`Config`
+objects, which support the attribute access of :any:`Parser` objects.
+
 Methods defined within a simulation module can be accessed by
 pass-through methods :meth:`Simulation.defaults` and :meth:`Simulation.new`:
 
@@ -40,12 +45,13 @@ Class Definition
 from pathlib import Path
 import importlib
 import warnings
+import time
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 
 
 # ctwrap specific import
-from .parser import Parser
+from .parser import Parser, Config, Overlay
 
 
 class Simulation(object):
@@ -57,6 +63,8 @@ class Simulation(object):
 
     Attributes:
         data: Dictionary containing simulation results.
+        timing: Timings of the most recent run in seconds (*parse_time* and
+            *solve_time*).
 
     Arguments:
         module: Handle name or handle to module running the simulation
@@ -68,7 +76,10 @@ class Simulation(object):
         assert isinstance(module, str), 'need module name'
 
         self._module = module
+        self._handle = None
         self.data = None # type: Dict
+        self.timing = {} # type: Dict[str, float]
+        self._base = None
 
         # ensure that module is well formed
         mod = self._load_module()
@@ -81,6 +92,7 @@ class Simulation(object):
                           DeprecationWarning)
 
         self.has_restart = hasattr(mod, 'restart')
+        self.has_batch = hasattr(mod, 'run_batch')
 
     @classmethod
     def from_module(cls, module: str) -> 'Simulation':
@@ -113,21 +125,47 @@ class Simulation(object):
         return type(name, (cls,), {})(module)
 
     def _load_module(self):
-        """Load simulation module (hidden)"""
+        """Load simulation module (hidden)
+
+        The module is loaded once per object and kept for subsequent calls.
+        """
+        if self._handle is not None:
+            return self._handle
+
         if Path(self._module).is_file():
             fname = Path(self._module)
             # https://stackoverflow.com/questions/19009932/import-arbitrary-python-source-file-python-3-3
             spec_file = importlib.util.spec_from_file_location(fname.stem, fname)
             spec_module = importlib.util.module_from_spec(spec_file)
             spec_file.loader.exec_module(spec_module)
-            return spec_module
+            self._handle = spec_module
+        else:
+            self._handle = importlib.import_module(self._module)
+
+        return self._handle
+
+    def _setup(self, config: Optional[Union[Dict[str, Any], Overlay]]) -> Config:
+        """Merge configuration with module defaults (hidden)"""
+        module = self._load_module()
+        if isinstance(config, Overlay):
+            # defaults are merged once and shared by overlays
+            if self._base is None or self._base[0] is not config.base:
+                setup = module.defaults()
+                setup.update(config.base)
+                if isinstance(setup, Parser):
+                    setup = setup.raw
+                self._base = (config.base, setup)
+            return Config(config.rebase(self._base[1]))
 
-        return importlib.import_module(self._module)
+        setup = module.defaults()
+        if config:
+            setup.update(config)
+        return Config(setup)
 
     def restart(
             self,
             restart: Any,
-            config: Optional[Dict[str, Any]]=None,
+            config: Optional[Union[Dict[str, Any], Overlay]]=None,
         ) -> bool:
         """Run the simulation module's ``restart`` method."""
         if self.has_restart:
@@ -137,7 +175,7 @@ class Simulation(object):
 
     def run(
             self,
-            config: Optional[Dict[str, Any]]=None,
+            config: Optional[Union[Dict[str, Any], Overlay]]=None,
             restart: Optional[Any]=None,
             **kwargs: str
         ) -> bool:
@@ -153,26 +191,74 @@ class Simulation(object):
             sim.run()
 
         Arguments:
-            config: Configuration used for simulation
+            config: Configuration used for simulation (dictionary or
+                copy-on-write :any:`Overlay`)
             restart: Data used for restart
             **kwargs: Optional parameters passed to the simulation
         """
         module = self._load_module()
         self.data = None
+        self.timing = {}
 
         if kwargs:
             warnings.warn("Keyword arguments are deprecated and ignored", DeprecationWarning)
 
-        setup = module.defaults()
-        if config:
-            setup.update(config)
-        config = Parser(setup)
+        start = time.perf_counter()
+        config = self._setup(config)
+        parsed = time.perf_counter()
 
         if restart is None:
             self.data = module.run(**config)
         else:
             self.data = module.restart(restart, **config)
 
+        self.timing = {'parse_time': parsed - start,
+                       'solve_time': time.perf_counter() - parsed}
+
+    def run_batch(
+            self,
+            configs: List[Union[Dict[str, Any], Overlay]]
+        ) -> List[Any]:
+        """Run the simulation module's ``run_batch`` method.
+
+        Simulation modules may define an optional ``run_batch`` method, which
+        takes a list of configurations and returns a list of results (one per
+        configuration); this allows for vectorized evaluation or re-use of
+        objects. If ``run_batch`` is not defined, the ``run`` method is called
+        for each configuration instead.
+
+        .. code-block:: Python
+
+            sim.run_batch([config_1, config_2])
+            data_1, data_2 = sim.data
+
+        Arguments:
+            configs: Configurations used for simulations
+
+        Returns:
+            List of results (also stored as *data* attribute)
+        """
+        module = self._load_module()
+        self.data = None
+        self.timing = {}
+
+        start = time.perf_counter()
+        setups = [self._setup(config) for config in configs]
+        parsed = time.perf_counter()
+
+        if self.has_batch:
+            data = list(module.run_batch(setups))
+            if len(data) != len(setups):
+                msg = "Method 'run_batch' returned {} results for {} configurations"
+                raise ValueError(msg.format(len(data), len(setups)))
+        else:
+            data = [module.run(**setup) for setup in setups]
+
+        self.data = data
+        self.timing = {'parse_time': parsed - start,
+                       'solve_time': time.perf_counter() - parsed}
+        return data
+
     def defaults(self) -> Dict[str, Any]:
         """Pass-through returning simulation module defaults as a dictionary"""
         module = self._load_module()
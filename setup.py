@@ -34,7 +34,7 @@ setup(
     author=__author__,
     author_email='ischoegl@lsu.edu',
     license='MIT',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks']),
     entry_points={
         'console_scripts': ['ctwrap=ctwrap.bin.ctwrap:main'],
     },
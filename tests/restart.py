@@ -0,0 +1,25 @@
+"""Restart module - passes Solution objects to subsequent tasks"""
+import cantera as ct
+
+
+def defaults():
+    """Returns dictionary containing default arguments"""
+    return {'foo': 300., 'bar': 1.}
+
+
+def restart(base, **kwargs):
+    """Restart from previous solution"""
+    return run(restart=base, **kwargs)
+
+
+def run(foo=300., bar=1., restart=None):
+    """Set state of Solution object"""
+    gas = ct.Solution('h2o2.yaml') if restart is None else restart
+    gas.TP = foo, bar * ct.one_atm
+    return gas
+
+
+if __name__ == "__main__":
+    """ Main function """
+    config = defaults()
+    out = run(**config)
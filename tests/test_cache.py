@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""rudimentary unit tests
+"""
+
+import unittest
+from pathlib import Path
+import tempfile
+import time
+import os
+import pandas as pd
+
+import warnings
+# add exception as pywintypes imports a deprecated module
+warnings.filterwarnings("ignore", ".*the imp module is deprecated*")
+
+# pylint: disable=import-error
+import ctwrap as cw
+from ctwrap.cache import ResultCache
+
+
+PWD = Path(__file__).parents[0]
+ROOT = PWD.parents[0]
+EXAMPLES = ROOT / 'ctwrap' / 'yaml'
+
+
+class TestCache(unittest.TestCase):
+
+    _config = {'mechanism': 'h2o2.yaml', 'state': {'T': '300. kelvin', 'P': '1. atmosphere'}}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key(self):
+        key = self.cache.key(self._config)
+        self.assertEqual(key, self.cache.key(dict(reversed(list(self._config.items())))))
+        self.assertNotEqual(key, self.cache.key(self._config, variation={'foo': 1}))
+
+        other = {**self._config, 'state': {'T': '400. kelvin', 'P': '1. atmosphere'}}
+        self.assertNotEqual(key, self.cache.key(other))
+
+        salted = ResultCache(self.tmp.name, salt=b'spam')
+        self.assertNotEqual(key, salted.key(self._config))
+
+    def test_mechanism(self):
+        mech = Path(self.tmp.name) / 'mech.yaml'
+        mech.write_text('foo')
+        config = {'model': {'mechanism': str(mech)}}
+        key = self.cache.key(config)
+
+        # keys depend on contents of mechanism files
+        mech.write_text('bar')
+        self.assertNotEqual(key, ResultCache(self.tmp.name).key(config))
+
+    def test_put(self):
+        key = self.cache.key(self._config)
+        self.assertNotIn(key, self.cache)
+        self.assertIsNone(self.cache.get(key))
+        self.assertTrue(self.cache.put(key, {'entry': 'foo', 'data': b'bar'}))
+        self.assertIn(key, self.cache)
+        self.assertEqual(self.cache.get(key), {'entry': 'foo', 'data': b'bar'})
+
+        # replaced records are not counted twice
+        self.assertTrue(self.cache.put(key, {'entry': 'foo', 'data': b'baz'}))
+        self.assertEqual(self.cache._used, self.cache._file(key).stat().st_size)
+
+        self.cache.clear()
+        self.assertNotIn(key, self.cache)
+
+    def test_evict(self):
+        cache = ResultCache(self.tmp.name, size=.0125) # three entries
+        keys = [cache.key({'foo': i}) for i in range(4)]
+        now = time.time()
+        for i, key in enumerate(keys[:3]):
+            cache.put(key, {'entry': 'foo', 'data': bytes(4000)})
+            os.utime(str(cache._file(key)), (now - 100 + i, now - 100 + i))
+
+        # mark first entry as recently used
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.put(keys[3], {'entry': 'foo', 'data': bytes(4000)})
+        self.assertEqual([key in cache for key in keys], [True, False, True, True])
+
+
+class TestHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'cache'
+        self.sim = cw.Simulation.from_module(str(ROOT / 'tests' / 'restart.py'))
+        self.content = {
+            'strategy': {'matrix': {'foo': [300., 400.], 'bar': [1., 2., 3.]}},
+            'defaults': {'foo': 300., 'bar': 1.},
+            'output': {'name': 'cached', 'format': 'csv', 'path': self.tmp.name,
+                       'force': True, 'returns': {'T': 'T', 'P': 'P'}},
+            'ctwrap': '0.3.0'
+        }
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_serial(self):
+        sh = cw.SimulationHandler.from_dict(self.content)
+        sh.run_serial(self.sim, cache=self.path)
+        out = cw.output.Output.from_dict(sh._output)
+        return out.info()
+
+    def test_serial(self):
+        info = self.run_serial()
+        self.assertFalse(any(val.get('cached') for val in info.values()))
+
+        # tasks that are shared with the previous run are cached
+        self.content['strategy']['matrix']['foo'] = [300., 400., 500.]
+        info = self.run_serial()
+        self.assertEqual(len(info), 9)
+        cached = {val['variation']['foo'] for val in info.values() if val.get('cached')}
+        self.assertEqual(cached, {300., 400.})
+
+    def test_restart(self):
+        self.run_serial()
+
+        # cached base cases cannot provide restart data for new tasks
+        self.content['strategy']['matrix']['bar'] = [1., 2., 3., 4.]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            info = self.run_serial()
+        self.assertFalse([w for w in caught if issubclass(w.category, RuntimeWarning)])
+        self.assertEqual(len(info), 8)
+        self.assertFalse(any(val.get('cached') for val in info.values()))
+
+        # tasks are cached if all tasks restarting from them are cached
+        self.content['strategy']['matrix']['foo'] = [300., 400., 500.]
+        info = self.run_serial()
+        self.assertEqual(len(info), 12)
+        cached = {val['variation']['foo'] for val in info.values() if val.get('cached')}
+        self.assertEqual(cached, {300., 400.})
+
+    def test_batch(self):
+        sim = cw.Simulation.from_module(cw.modules.solution)
+        sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        sh._output['path'] = self.tmp.name
+        out = cw.output.Output.from_dict(sh._output)
+        sh.run_parallel(sim, number_of_processes=2, cache=self.path)
+        df = pd.read_csv(out.output_name).sort_values('output', ignore_index=True)
+        sh.close()
+
+        sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        sh._output['path'] = self.tmp.name
+        sh.run_serial(sim, cache=self.path)
+        self.assertTrue(all(val.get('cached') for val in out.info().values()))
+        other = pd.read_csv(out.output_name).sort_values('output', ignore_index=True)
+        pd.testing.assert_frame_equal(df, other)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,10 @@
 import pytest
 import unittest
 from pathlib import Path
+import io
+import json
 import h5py
+import pandas as pd
 
 try:
     import ruamel_yaml as yaml
@@ -60,9 +63,8 @@ class TestOutput(unittest.TestCase):
         if not self._output:
             return
 
-        fname = Path(self._output.output_name)
-        if fname.is_file():
-            fname.unlink()
+        # remove output file and sidecar files
+        self._output.clear()
 
     def test_output(self):
         if not self._output:
@@ -86,6 +88,57 @@ class TestCSV(TestOutput):
         self.assertEqual(self._output.settings['format'], 'csv')
 
 
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        self._output = cwo.Output.from_dict({'format': 'csv', 'name': 'stream.csv'}, file_path=PWD)
+
+    def tearDown(self):
+        self._output.clear()
+        self.assertFalse(self._output._index.is_file())
+
+    def _record(self, entry, **kwargs):
+        return {'entry': entry, 'row': pd.Series({'output': entry, **kwargs})}
+
+    def test_columns(self):
+        self.assertTrue(self._output.write([self._record('foo', a=1., b='x,y')]))
+        self.assertTrue(self._output.write([self._record('bar', b='z', c=3)]))
+        self._output.write([self._record('baz', a=float('nan'))])
+        self._output.finalize({})
+
+        df = pd.read_csv(self._output.output_name)
+        self.assertEqual(list(df.columns), ['output', 'a', 'b', 'c'])
+        self.assertEqual(list(df.output), ['foo', 'bar', 'baz'])
+        self.assertEqual(df.b[0], 'x,y')
+        self.assertEqual(df.c[1], 3)
+        self.assertTrue(df.isna().c[0] and df.isna().a[2])
+        self.assertEqual(self._output.dir(), ['foo', 'bar', 'baz'])
+
+    def test_index(self):
+        # files written without index
+        pd.DataFrame({'output': ['foo', 'bar'], 'a': [1., 2.]}).to_csv(
+            self._output.output_name, index=False)
+        self.assertEqual(self._output.dir(), ['foo', 'bar'])
+        self._output._index.unlink()
+
+        self._output.write([self._record('baz', a=3.)])
+        self.assertEqual(self._output.dir(), ['foo', 'bar', 'baz'])
+        self.assertTrue(self._output.remove(['bar']))
+        self.assertEqual(self._output.dir(), ['foo', 'baz'])
+        self._output.write([self._record('spam', a=4.)])
+        self._output.close()
+        df = pd.read_csv(self._output.output_name)
+        self.assertEqual(list(df.output), ['foo', 'baz', 'spam'])
+        self.assertEqual(list(df.a), [1., 3., 4.])
+
+    def test_info(self):
+        records = [{**self._record(entry), 'info': {'wall_time': 1.}} for entry in ['foo', 'bar']]
+        self._output.write(records)
+        self.assertEqual(set(self._output.info()), {'foo', 'bar'})
+        self._output.remove(['foo'])
+        self.assertEqual(self._output.info(), {'bar': {'wall_time': 1.}})
+
+
 @pytest.mark.skipif(isinstance(ct, ImportError), reason="Cantera not installed")
 class TestSolution(TestCSV):
 
@@ -134,6 +187,74 @@ class TestHDF(TestOutput):
         self.assertEqual(self._output.settings['format'], 'h5')
 
 
+class TestPack(unittest.TestCase):
+
+    _settings = {'format': 'h5', 'name': 'packed.h5'}
+
+    def setUp(self):
+        self._output = cwo.Output.from_dict(self._settings, file_path=PWD)
+
+    def tearDown(self):
+        self._output.clear()
+
+    def test_write(self):
+        records = []
+        for entry in ['foo', 'bar']:
+            data = {entry: ('RuntimeError', 'Hello {}!'.format(entry))}
+            records.append(self._output.pack(data, entry, errored=True))
+        self.assertTrue(all(isinstance(rec['data'], bytes) for rec in records))
+        self.assertFalse(Path(self._output.output_name).is_file())
+
+        self.assertTrue(self._output.write(records))
+        self.assertEqual(set(self._output.dir()), {'foo', 'bar'})
+        with h5py.File(self._output.output_name, 'r') as hdf:
+            self.assertEqual(hdf['foo/foo'].attrs['RuntimeError'], 'Hello foo!')
+
+        with self.assertRaisesRegex(RuntimeError, "Cannot overwrite"):
+            self._output.write(records[:1])
+
+    def test_completed(self):
+        buffer = io.BytesIO()
+        with h5py.File(buffer, 'w') as hdf:
+            hdf.create_dataset('spam/eggs', data=[1., 2.])
+        record = {'entry': 'spam', 'data': buffer.getvalue(), 'errored': False}
+        data = {'foo': ('RuntimeError', 'Hello world!')}
+        self._output.write([record, self._output.pack(data, 'foo', errored=True)])
+        self.assertEqual(set(self._output.dir()), {'foo', 'spam'})
+        self.assertEqual(self._output.completed(), ['spam'])
+
+        record = self._output.record('spam')
+        with h5py.File(io.BytesIO(record['data']), 'r') as hdf:
+            self.assertEqual(list(hdf['spam/eggs']), [1., 2.])
+        self.assertIsNone(self._output.record('bar'))
+
+        self._output.remove(['foo'])
+        self.assertEqual(self._output.dir(), ['spam'])
+
+    def test_handle(self):
+        for entry in ['foo', 'bar']:
+            data = {entry: ('RuntimeError', 'Hello {}!'.format(entry))}
+            self._output.write([self._output.pack(data, entry, errored=True)])
+        hdf = self._output._hdf
+        self.assertTrue(hdf.id.valid)
+        self.assertEqual(self._output.dir(), ['bar', 'foo'])
+
+        self.assertTrue(self._output.finalize({'spam': {'eggs': 1}}))
+        self.assertFalse(hdf.id.valid)
+        with h5py.File(self._output.output_name, 'r') as hdf:
+            self.assertEqual(json.loads(hdf.attrs['spam']), {'eggs': 1})
+            self.assertEqual(set(hdf.keys()), {'foo', 'bar'})
+
+    def test_replaced(self):
+        data = {'foo': ('RuntimeError', 'Hello world!')}
+        record = self._output.pack(data, 'foo', errored=True)
+        self._output.write([record])
+        Path(self._output.output_name).unlink()
+        self.assertEqual(self._output.dir(), [])
+        self.assertTrue(self._output.write([record]))
+        self.assertEqual(self._output.dir(), ['foo'])
+
+
 @pytest.mark.skipif(isinstance(ct, ImportError), reason="Cantera not installed")
 class TestSolutionArray(TestHDF):
 
@@ -4,7 +4,12 @@
 """
 
 import unittest
+import os
+import pickle
+import tempfile
+from copy import deepcopy
 from pathlib import Path
+import pint
 import pint.quantity as pq
 
 try:
@@ -85,6 +90,117 @@ class TestParse(unittest.TestCase):
         self.assertEqual(unit, 'dimensionless')
 
 
+class TestCached(unittest.TestCase):
+
+    def test_quantity(self):
+
+        p = cw.Parser({'T': '300. kelvin', 'P': '1. atmosphere'})
+        self.assertEqual(p.T, cw.parser.ureg.Quantity('300. kelvin'))
+        self.assertEqual(p.P.m_as('pascal'), 101325.)
+        self.assertAlmostEqual(p.P.m_as('bar'), 1.01325)
+        self.assertAlmostEqual(p.T.m_as('degC'), 26.85)
+        with self.assertRaises(pint.DimensionalityError):
+            p.T.m_as('pascal')
+
+    def test_mutable(self):
+
+        p = cw.Parser({'P': '1. atmosphere'})
+        value = p.P
+        value.ito('pascal')
+        self.assertEqual(value.m, 101325.)
+        self.assertEqual(p.P.m, 1.)
+        self.assertIsNot(p.P, p.P)
+
+
+class TestConfig(unittest.TestCase):
+
+    _dict = {'foo': {'T': '300. kelvin', 'P': '1. atmosphere', 'spam': 'eggs'},
+             'bar': 2., 'baz': '30 millimeter'}
+
+    def test_access(self):
+
+        c = cw.Config(self._dict)
+        p = cw.Parser(self._dict)
+        self.assertIsInstance(c, cw.Parser)
+        self.assertIsInstance(c.foo, cw.Config)
+        self.assertEqual(c, p)
+        self.assertEqual(list(c.keys()), list(p.keys()))
+        self.assertEqual(c.foo.T, p.foo.T)
+        self.assertEqual(c.foo['spam'], 'eggs')
+        self.assertEqual(c.get('bar'), 2.)
+        self.assertIsNone(c.get('qux'))
+        self.assertEqual(dict(**c)['baz'], p.baz)
+        with self.assertRaisesRegex(AttributeError, "unknown attribute"):
+            c.qux
+
+    def test_si(self):
+
+        c = cw.Config(self._dict)
+        self.assertEqual(c.foo.si('T'), 300.)
+        self.assertEqual(c.foo.si('P'), 101325.)
+        self.assertAlmostEqual(c.si('baz'), .03)
+        with self.assertRaisesRegex(KeyError, "not a quantity"):
+            c.si('bar')
+
+    def test_immutable(self):
+
+        c = cw.Config(self._dict)
+        with self.assertRaisesRegex(AttributeError, "immutable"):
+            c.bar = 3.
+        with self.assertRaisesRegex(TypeError, "immutable"):
+            c.update({'bar': 3.})
+        c.raw['bar'] = 3.
+        self.assertEqual(c.bar, 2.)
+        self.assertFalse(hasattr(c, '__dict__'))
+
+    def test_deferred(self):
+
+        c = cw.Config({'foo': '1 spam', 'bar': 2.})
+        self.assertIn('foo', c)
+        self.assertEqual(c.bar, 2.)
+        with self.assertRaises(pint.UndefinedUnitError):
+            c.foo
+
+    def test_pickle(self):
+
+        c = cw.Config(self._dict)
+        self.assertEqual(pickle.loads(pickle.dumps(c)), c)
+        self.assertEqual(deepcopy(c).foo.T, c.foo.T)
+
+
+class TestOverlay(unittest.TestCase):
+
+    _dict = {'foo': {'T': '300. kelvin', 'spam': [1, 2]}, 'bar': {'baz': 2.}}
+
+    def test_resolve(self):
+
+        o = cw.Overlay(self._dict, {'foo.T': 400., 'qux': 1.})
+        self.assertEqual(o.delta, {'foo.T': 400.})
+        out = o.resolve()
+        self.assertEqual(out['foo']['T'], '400.0 kelvin')
+        self.assertEqual(self._dict['foo']['T'], '300. kelvin')
+        # unchanged entries are shared
+        self.assertIs(out['bar'], self._dict['bar'])
+        self.assertIs(out['foo']['spam'], self._dict['foo']['spam'])
+
+    def test_consumers(self):
+
+        o = cw.Overlay(self._dict, {'foo.T': 400., 'bar.baz': 3.})
+        self.assertEqual(cw.Config(o).foo.T.m_as('kelvin'), 400.)
+        p = cw.Parser(o)
+        p.update({'bar': {'baz': 4.}})
+        self.assertEqual(p.bar.baz, 4.)
+        self.assertEqual(self._dict['bar']['baz'], 2.)
+        self.assertEqual(o.rebase({'bar': {'baz': 1., 'eggs': 0}}).resolve(),
+                         {'bar': {'baz': 3., 'eggs': 0}})
+        self.assertEqual(pickle.loads(pickle.dumps(o)), o)
+
+        # mutable entries are not shared with consumers
+        c = cw.Config(o)
+        c.foo.spam.append(3)
+        self.assertEqual(self._dict['foo']['spam'], [1, 2])
+
+
 class TestWrite(unittest.TestCase):
 
     def test_string(self):
@@ -231,3 +347,28 @@ class TestYAML(unittest.TestCase):
         self.assertEqual(str(up.T.units), 'kelvin')
         self.assertEqual(up.T.m - 273.15, up.T.m_as('degC'))
         self.assertIsInstance(up.fuel, str)
+
+    def test_cached(self):
+
+        with tempfile.TemporaryDirectory() as tmp:
+            fname = Path(tmp) / 'cached.yaml'
+            fname.write_text('foo: 1e5\nbar: [1, 2]\n')
+            p1 = cw.Parser.from_yaml('cached.yaml', path=tmp)
+            self.assertEqual(p1.raw, {'foo': 1e5, 'bar': [1, 2]})
+
+            # cached content is not shared
+            p1.raw['bar'].append(3)
+            p2 = cw.Parser.from_yaml('cached.yaml', path=tmp)
+            self.assertEqual(p2.bar, [1, 2])
+
+            # modified files are parsed again
+            fname.write_text('foo: 2.\n')
+            stat = fname.stat()
+            os.utime(str(fname), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertEqual(cw.Parser.from_yaml('cached.yaml', path=tmp).raw, {'foo': 2.})
+
+    def test_loader(self):
+
+        yml = 'a: yes\nb: 1e5\nc: 0o10\nd: ~\ne: 1_000\nf: O2:1,AR:5\n'
+        self.assertEqual(cw.Parser.from_yaml(yml).raw,
+                         yaml.load(yml, Loader=yaml.SafeLoader))
@@ -180,6 +180,58 @@ class TestStrategy(unittest.TestCase):
         tasks = mat.configurations(defaults)
         self.assertEqual(len(tasks), 6)
 
+    def test_lazy(self):
+
+        mat = cw.Matrix({'foo.spam': [1, 2, 3], 'bar': [4, 5], 'baz': list(range(10))})
+        defaults = {'foo': {'spam': 0}, 'bar': 0, 'baz': 0}
+        tasks = mat.configurations(defaults)
+        self.assertEqual(len(tasks), 60)
+        self.assertEqual(tasks, cw.Strategy._label(_sweep_matrix(mat.matrix, defaults)))
+        self.assertEqual(mat.variations, cw.Strategy._label(_task_list(mat.matrix)))
+
+        # cases are accessible by label and ordinal
+        self.assertEqual(tasks.label(37), 'case_37')
+        self.assertEqual(tasks.ordinal('case_37'), 37)
+        self.assertEqual(tasks['case_37'], {'foo': {'spam': 2}, 'bar': 5, 'baz': 7})
+        self.assertNotIn('case_7', tasks)
+        self.assertNotIn('case_60', tasks)
+        with self.assertRaises(KeyError):
+            tasks['case_60']
+
+        # entries are independent copies
+        tasks['case_00']['foo']['spam'] = None
+        self.assertEqual(tasks['case_00']['foo']['spam'], 1)
+        self.assertEqual(defaults['foo']['spam'], 0)
+
+    def test_base(self):
+
+        mat = cw.Matrix({'foo': [1, 2, 3], 'bar': [4, 5], 'baz': [6, 7, 8, 9]})
+        self.assertIsNone(mat.base('case_00'))
+        self.assertIsNone(mat.base('case_04'))
+        self.assertEqual(mat.base('case_05'), 'case_04')
+        self.assertEqual(len(mat.bases()), 18)
+        self.assertEqual(mat.successors()['case_04'], ['case_05'])
+
+        # restarts along other axes
+        self.assertEqual(mat.base('case_04', axis=1), 'case_00')
+        self.assertEqual(mat.base('case_17', axis=0), 'case_09')
+        self.assertEqual(len(mat.bases(axis=0)), 16)
+
+        # index is cached
+        self.assertIs(mat.bases(), mat.bases(axis=2))
+        self.assertIs(mat.variations, mat.variations)
+
+        seq = cw.Sequence({'foo': [1, 2, 3]})
+        self.assertIsNone(seq.base('case_1'))
+        self.assertEqual(seq.bases(), {})
+
+    def test_large(self):
+
+        mat = cw.Matrix({k: list(range(20)) for k in 'abcde'})
+        tasks = mat.configurations({k: 0 for k in 'abcde'})
+        self.assertEqual(len(tasks), 20**5)
+        self.assertEqual(tasks['case_3199999'], {k: 19 for k in 'abcde'})
+
     def test_minimal(self):
 
         mm = cw.Parser.from_yaml('minimal.yaml', path=EXAMPLES)
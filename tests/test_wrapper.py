@@ -6,9 +6,17 @@
 import unittest
 from pathlib import Path
 import subprocess
+import sys
 import pint.quantity as pq
 import importlib
+import asyncio
+from collections.abc import Mapping
 import h5py
+import pstats
+import tempfile
+import io
+from unittest import mock
+import time
 
 try:
     import ruamel_yaml as yaml
@@ -28,17 +36,34 @@ ROOT = PWD.parents[0]
 EXAMPLES = ROOT / 'ctwrap' / 'yaml'
 
 
+class TestImport(unittest.TestCase):
+
+    def test_lazy(self):
+        # heavy dependencies are not loaded by import
+        cmd = ("import sys, ctwrap; "
+               "print(','.join(m for m in ['pint', 'pandas', 'h5py', 'cantera'] if m in sys.modules))")
+        out = subprocess.run([sys.executable, '-c', cmd], stdout=subprocess.PIPE, check=True)
+        self.assertEqual(out.stdout.decode().strip(), '')
+
+    def test_modules(self):
+        self.assertEqual(sorted(m for m in dir(cw.modules) if not m.startswith('__')),
+                         sorted(cw.modules.__all__))
+        self.assertEqual(cw.modules.minimal.__name__, 'ctwrap.modules.minimal')
+        with self.assertRaises(AttributeError):
+            cw.modules.spam
+
+
 class TestLegacy(unittest.TestCase):
 
     def test_handler(self):
         with self.assertWarnsRegex(PendingDeprecationWarning, "Old implementation"):
             sh = cw.SimulationHandler.from_yaml('legacy.yaml', database=EXAMPLES)
-        self.assertIsInstance(sh.tasks, dict)
+        self.assertIsInstance(sh.tasks, Mapping)
 
     def test_database(self):
         with self.assertWarnsRegex(PendingDeprecationWarning, "Old implementation"):
             sh = cw.SimulationHandler.from_yaml('legacy.yaml')
-        self.assertIsInstance(sh.tasks, dict)
+        self.assertIsInstance(sh.tasks, Mapping)
 
 
 class TestWrap(unittest.TestCase):
@@ -60,9 +85,10 @@ class TestWrap(unittest.TestCase):
 
     def tearDown(self):
         if self._out:
-            [out.unlink() for out in Path(EXAMPLES).glob('*.h5')]
-            [out.unlink() for out in Path(ROOT).glob('*.h5')]
-            [out.unlink() for out in Path(ROOT).glob('*.csv')]
+            # includes output of command line runs
+            for pattern in ['*.h5', '*.csv', '*.jsonl', '*.index']:
+                [out.unlink() for out in Path(EXAMPLES).glob(pattern)]
+                [out.unlink() for out in Path(ROOT).glob(pattern)]
 
     def test_simulation(self):
         self.assertIsNone(self.sim.data)
@@ -91,7 +117,7 @@ class TestWrap(unittest.TestCase):
                 self.sim.restart(old)
 
     def test_handler(self):
-        self.assertIsInstance(self.sh.tasks, dict)
+        self.assertIsInstance(self.sh.tasks, Mapping)
 
     def test_serial(self):
         if self._skip_long:
@@ -150,6 +176,496 @@ class TestWrap(unittest.TestCase):
         self.assertEqual(stderr.decode(), '')
 
 
+class TestPool(unittest.TestCase):
+
+    def setUp(self):
+        self.sim = cw.Simulation.from_module(cw.modules.minimal)
+        self.sh = cw.SimulationHandler.from_yaml('minimal.yaml', strategy='sequence', database=EXAMPLES)
+
+    def tearDown(self):
+        self.sh.close()
+
+    def test_persistent(self):
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2))
+        workers = self.sh._pool.processes
+        self.assertTrue(all(p.is_alive() for p in workers))
+
+        # workers may start processes of their own
+        self.assertFalse(any(p.daemon for p in workers))
+
+        # workers are re-used by subsequent batches
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2))
+        self.assertEqual(workers, self.sh._pool.processes)
+
+        self.sh.close()
+        self.assertIsNone(self.sh._pool)
+        self.assertFalse(any(p.is_alive() for p in workers))
+
+    def test_context(self):
+        with cw.SimulationHandler.from_yaml('minimal.yaml', strategy='sequence', database=EXAMPLES) as sh:
+            self.assertTrue(sh.run_parallel(self.sim, number_of_processes=2))
+            workers = sh._pool.processes
+        self.assertFalse(any(p.is_alive() for p in workers))
+
+
+    def test_as_completed(self):
+        tasks = []
+        for task, variation, result in self.sh.as_completed(self.sim, number_of_processes=2):
+            self.assertEqual(variation, self.sh.tasks[task])
+            self.assertEqual(result['status'], 'done')
+            self.assertGreater(result['wall_time'], 0)
+            tasks.append(task)
+        self.assertEqual(sorted(tasks), sorted(self.sh.tasks))
+
+        # stopping early leaves no pending jobs
+        results = self.sh.as_completed(self.sim, number_of_processes=2)
+        next(results)
+        results.close()
+        self.assertFalse(self.sh._pool._busy)
+
+    def test_options(self):
+        with self.assertRaisesRegex(TypeError, "'spam'"):
+            next(self.sh.as_completed(self.sim, number_of_processes=2, spam=1))
+        with self.assertWarnsRegex(DeprecationWarning, "deprecated"):
+            self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2, spam=1))
+
+    def test_async(self):
+
+        async def collect():
+            return [task async for task, _, _ in self.sh.run_async(self.sim, number_of_processes=2)]
+
+        loop = asyncio.new_event_loop()
+        try:
+            tasks = loop.run_until_complete(collect())
+        finally:
+            loop.close()
+        self.assertEqual(sorted(tasks), sorted(self.sh.tasks))
+
+    def test_async_cancel(self):
+
+        async def consume():
+            async for _ in self.sh.run_async(self.sim, number_of_processes=2):
+                pass
+
+        loop = asyncio.new_event_loop()
+        try:
+            # cancellation waits for pending results before closing the batch
+            with self.assertRaises(asyncio.TimeoutError):
+                loop.run_until_complete(asyncio.wait_for(consume(), .3))
+        finally:
+            loop.close()
+        self.assertFalse(self.sh._pool._busy)
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2))
+
+
+    def test_chunks(self):
+        for chunk_size in [3, None]:
+            tasks = [task for task, _, result in self.sh.as_completed(
+                self.sim, number_of_processes=2, chunk_size=chunk_size)
+                     if result['status'] == 'done']
+            self.assertEqual(sorted(tasks), sorted(self.sh.tasks))
+
+    def test_timeout(self):
+        # wide margin between task durations and timeout
+        content = {'strategy': {'sequence': {'foo': [.05, 2.]}},
+                   'defaults': {'foo': .05, 'bar': 1}, 'ctwrap': '0.3.0'}
+        with cw.SimulationHandler.from_dict(content) as sh:
+            with self.assertWarnsRegex(RuntimeWarning, "exceeded timeout"):
+                results = {task: result['status'] for task, _, result
+                           in sh.as_completed(self.sim, number_of_processes=2, timeout=1)}
+            self.assertEqual(results, {'case_0': 'done', 'case_1': 'errored'})
+            self.assertEqual(len(sh._pool.processes), 2)
+
+    def test_expired(self):
+
+        class Graph(cw.handler._TaskGraph):
+            checks = 0
+
+            @property
+            def ready(self):
+                # deadline passes after the first check
+                self.checks += 1
+                if self.checks > 1:
+                    self._deadline = 0.
+                return super().ready
+
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2))
+        graph = Graph(self.sh._configurations, {}, budget=100., workers=2)
+        results = list(self.sh._pool.run(graph, chunk_size=1))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(graph.expired), len(self.sh.tasks) - 2)
+        self.assertFalse(self.sh._pool._busy)
+
+    def test_recycle(self):
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2, max_tasks=3))
+        workers = self.sh._pool.processes
+        self.assertEqual(len(workers), 2)
+        self.assertTrue(all(p.is_alive() for p in workers))
+
+
+class TestResume(unittest.TestCase):
+
+    def setUp(self):
+        self.sim = cw.Simulation.from_module(cw.modules.solution)
+        self.sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        self.out = cw.output.Output.from_dict(self.sh._output)
+
+    def tearDown(self):
+        self.sh.close()
+        self.out.clear()
+
+    def test_resume(self):
+        self.assertTrue(self.sh.run_serial(self.sim))
+        tasks = list(self.sh.tasks)
+        self.assertEqual(self.out.completed(), tasks)
+
+        missing = tasks[3:6]
+        self.out.remove(missing)
+        self.assertEqual(len(self.out.dir()), len(tasks) - len(missing))
+
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2, resume=True))
+        done = self.out.dir()
+        self.assertEqual(sorted(done), tasks)
+        self.assertEqual(sorted(done[-len(missing):]), missing)
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        self.out = cw.output.Output.from_dict(self.sh._output)
+        self.tasks = list(self.sh.tasks)[:3]
+        self.configs = [self.sh.configuration(t) for t in self.tasks]
+
+    def test_fallback(self):
+        sim = cw.Simulation.from_module(cw.modules.minimal)
+        self.assertFalse(sim.has_batch)
+        data = sim.run_batch([{'foo': 0}, {'foo': 0.01}])
+        self.assertEqual(data, [{'sleep': [0]}, {'sleep': [0.01]}])
+        self.assertEqual(sim.data, data)
+
+    def test_run_batch(self):
+        sim = cw.Simulation.from_module(cw.modules.solution)
+        self.assertTrue(sim.has_batch)
+        data = sim.run_batch(self.configs)
+        self.assertEqual(len(data), len(self.configs))
+        for task, config, val in zip(self.tasks, self.configs, data):
+            sim.run(config)
+            row = self.out.pack(sim.data, entry=task)['row']
+            self.assertEqual(list(row), list(self.out.pack(val, entry=task)['row']))
+
+    def test_runner(self):
+        runner = cw.handler._Runner('ctwrap.modules.solution', self.sh._strategy.definition,
+                                    self.sh._defaults, self.sh._output, 0)
+        results = runner.batch([(i, None) for i in range(len(self.tasks))])
+        self.assertEqual([res[0] for res in results], self.tasks)
+        self.assertTrue(all(res[1] == 'done' for res in results))
+
+        # configurations are created from task ordinals (copy-on-write)
+        task, config, restart = runner.job(1)
+        self.assertEqual(task, self.tasks[1])
+        self.assertIsInstance(config, cw.Overlay)
+        self.assertEqual(config.resolve(), self.configs[1])
+        self.assertIsNone(restart)
+
+
+class TestBroker(unittest.TestCase):
+
+    def setUp(self):
+        self.sim = cw.Simulation.from_module(cw.modules.solution)
+        self.sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        self.out = cw.output.Output.from_dict(self.sh._output)
+
+    def tearDown(self):
+        self.out.clear()
+
+    def test_local(self):
+        self.assertTrue(self.sh.run_distributed(
+            self.sim, ('localhost', 0), authkey='ctwrap', number_of_processes=2))
+        self.assertEqual(sorted(self.out.completed()), sorted(self.sh.tasks))
+
+    def test_timeout(self):
+        content = {'strategy': {'sequence': {'foo': [.05, 3.]}},
+                   'defaults': {'foo': .05, 'bar': 1}, 'ctwrap': '0.3.0'}
+        sh = cw.SimulationHandler.from_dict(content)
+        sim = cw.Simulation.from_module(cw.modules.minimal)
+        with self.assertWarnsRegex(RuntimeWarning, "exceeded timeout"):
+            sh.run_distributed(sim, ('localhost', 0), authkey='ctwrap',
+                               number_of_processes=2, timeout=1)
+
+    def test_authkey(self):
+        with self.assertRaisesRegex(ValueError, "explicit authentication key"):
+            self.sh.run_distributed(self.sim, ('localhost', 0))
+
+        from ctwrap.bin import ctwrap as cli
+        argv = ['ctwrap', 'run', 'solution', str(EXAMPLES / 'solution.yaml'), '--broker', ':0']
+        with mock.patch('sys.argv', argv), mock.patch('sys.stderr', io.StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                cli.main()
+        self.assertIn('--authkey is required', err.getvalue())
+
+        argv += ['--authkey', 'ctwrap', '--max-tasks', '10']
+        with mock.patch('sys.argv', argv), mock.patch('sys.stderr', io.StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                cli.main()
+        self.assertIn('--max-tasks is not supported', err.getvalue())
+
+
+class TestTelemetry(unittest.TestCase):
+
+    _keys = {'worker', 'queue_time', 'load_time', 'parse_time', 'solve_time',
+             'output_time', 'wall_time', 'variation'}
+
+    def setUp(self):
+        self.sim = cw.Simulation.from_module(cw.modules.solution)
+        self.sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        self.out = cw.output.Output.from_dict(self.sh._output)
+
+    def tearDown(self):
+        self.sh.close()
+        self.out.clear()
+
+    def test_serial(self):
+        self.assertTrue(self.sh.run_serial(self.sim))
+        info = self.out.info()
+        self.assertEqual(sorted(info), sorted(self.sh.tasks))
+        for task, val in info.items():
+            self.assertTrue(self._keys.issubset(val))
+            self.assertEqual(val['variation'], self.sh.tasks[task])
+
+    def test_parallel(self):
+        self.assertTrue(self.sh.run_parallel(self.sim, number_of_processes=2))
+        workers = {val['worker'] for val in self.out.info().values()}
+        self.assertTrue(workers.issubset({p.name for p in self.sh._pool.processes}))
+
+    def test_task(self):
+        self.sh.run_task(self.sim, 'case_01')
+        info = self.out.info()['case_01']
+        self.assertTrue((self._keys - {'queue_time'}).issubset(info))
+
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.sim = cw.Simulation.from_module(cw.modules.minimal)
+        content = {'strategy': {'sequence': {'foo': [0., 0., 0., 0., 0., 0., 0., 0.]}},
+                   'defaults': {'foo': 0., 'bar': 1}, 'ctwrap': '0.3.0'}
+        self.sh = cw.SimulationHandler.from_dict(content)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'prof'
+
+    def tearDown(self):
+        self.sh.close()
+        self.tmp.cleanup()
+
+    def test_serial(self):
+        # unrelated profiles are neither removed nor merged
+        self.path.mkdir()
+        (self.path / 'other.prof').write_bytes(b'')
+        self.sh.run_serial(self.sim, profile=self.path)
+        files = {f.stem for f in self.path.glob('*.prof')}
+        self.assertEqual(files, set(self.sh.tasks) | {'batch', 'other'})
+        stats = pstats.Stats(str(self.path / 'batch.prof'))
+        self.assertTrue(any(func[0].endswith('minimal.py') for func in stats.stats))
+
+    def test_batch(self):
+        sim = cw.Simulation.from_module(cw.modules.solution)
+        sh = cw.SimulationHandler.from_yaml('solution.yaml', database=EXAMPLES)
+        sh._output = None
+        sh.run_serial(sim, profile=self.path)
+        tasks = list(sh.tasks)
+        files = {f.stem for f in self.path.glob('*.prof')}
+        self.assertIn('{}-{}'.format(tasks[0], tasks[-1]), files)
+
+    def test_sample(self):
+        self.sh.run_parallel(self.sim, number_of_processes=2,
+                             profile=self.path, profile_sample=.5)
+        files = {f.stem for f in self.path.glob('*.prof')} - {'batch'}
+        self.assertTrue(files < set(self.sh.tasks))
+
+        # sampled tasks are reproducible
+        self.sh.run_serial(self.sim, profile=self.path, profile_sample=.5)
+        self.assertEqual({f.stem for f in self.path.glob('*.prof')} - {'batch'}, files)
+
+
+class TestRestartCache(unittest.TestCase):
+
+    _module = str(ROOT / 'tests' / 'restart.py')
+
+    def setUp(self):
+        self.sim = cw.Simulation.from_module(self._module)
+        self.tmp = tempfile.TemporaryDirectory()
+        content = {
+            'strategy': {'matrix': {'foo': [300., 400., 500.], 'bar': [1., 2., 3., 4.]}},
+            'defaults': {'foo': 300., 'bar': 1.},
+            'output': {'name': 'restart', 'format': 'csv', 'path': self.tmp.name,
+                       'returns': {'T': 'T', 'P': 'P'}},
+            'ctwrap': '0.3.0'
+        }
+        self.sh = cw.SimulationHandler.from_dict(content)
+        self.out = cw.output.Output.from_dict(self.sh._output)
+
+    def tearDown(self):
+        self.sh.close()
+        self.tmp.cleanup()
+
+    def check(self):
+        # CSV output does not support restarts; results are cached instead
+        self.assertEqual(sorted(self.out.completed()), sorted(self.sh.tasks))
+        for task, val in self.out.info().items():
+            self.assertEqual(val['variation'], self.sh.tasks[task])
+
+    def test_serial(self):
+        self.assertTrue(self.sim.has_restart)
+        self.sh.run_serial(self.sim)
+        self.check()
+
+    def test_parallel(self):
+        self.sh.run_parallel(self.sim, number_of_processes=2, chunk_size=1)
+        self.check()
+
+
+class TestMutable(unittest.TestCase):
+
+    _module = (
+        "def defaults():\n"
+        "    return {'foo': 1., 'grid': [0., 1.]}\n"
+        "\n"
+        "def run(foo=1., grid=None):\n"
+        "    grid.append(foo)\n"
+        "    return {'grid': grid}\n")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        module = Path(self.tmp.name) / 'mutable.py'
+        module.write_text(self._module)
+        self.sim = cw.Simulation.from_module(str(module))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_serial(self):
+        # modules changing arguments in place do not affect other tasks
+        content = {'strategy': {'sequence': {'foo': [1., 2., 3.]}},
+                   'defaults': {'foo': 1., 'grid': [0., 1.]}, 'ctwrap': '0.3.0'}
+        sh = cw.SimulationHandler.from_dict(content)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertTrue(sh.run_serial(self.sim))
+        self.assertFalse([w for w in caught if issubclass(w.category, RuntimeWarning)])
+        self.assertEqual(sh._defaults, {'foo': 1., 'grid': [0., 1.]})
+
+
+class TestTaskGraph(unittest.TestCase):
+
+    def test_dependencies(self):
+        strategy = cw.Strategy.load({'matrix': {'foo': [1, 2], 'bar': [3, 4, 5]}})
+        configs = strategy.configurations({'foo': 0, 'bar': 0})
+        bases = {t: strategy.base(t) for t in configs if strategy.base(t)}
+        self.assertEqual(len(bases), 4)
+
+        graph = cw.handler._TaskGraph(configs, bases)
+        heads = []
+        while graph.ready:
+            heads.append(graph.pop()[0])
+        self.assertEqual(heads, ['case_0', 'case_3'])
+
+        graph.complete('case_0', 'done', {'entry': 'case_0'})
+        task, ordinal, restart = graph.pop()
+        self.assertEqual(task, 'case_1')
+        self.assertEqual(ordinal, 1)
+        self.assertEqual(restart, {'entry': 'case_0'})
+        self.assertFalse(graph.ready)
+
+        # errored base cases do not provide restart data
+        graph.complete('case_3', 'errored', {'entry': 'case_3'})
+        self.assertEqual(graph.pop(), ('case_4', 4, None))
+
+    def test_completed(self):
+        strategy = cw.Strategy.load({'matrix': {'foo': [1, 2], 'bar': [3, 4, 5]}})
+        configs = strategy.configurations({'foo': 0, 'bar': 0})
+        bases = {t: strategy.base(t) for t in configs if strategy.base(t)}
+
+        loader = lambda entry: {'entry': entry}
+        graph = cw.handler._TaskGraph(configs, bases, {'case_0', 'case_1', 'case_3'}, loader)
+        jobs = []
+        while graph.ready:
+            jobs.append(graph.pop())
+        # longer restart chains are dispatched first
+        self.assertEqual([job[0] for job in jobs], ['case_4', 'case_2'])
+        self.assertEqual([job[2] for job in jobs], [{'entry': 'case_3'}, {'entry': 'case_1'}])
+
+    def test_affinity(self):
+        strategy = cw.Strategy.load({'matrix': {'foo': [1, 2], 'bar': [3, 4, 5]}})
+        configs = strategy.configurations({'foo': 0, 'bar': 0})
+        graph = cw.handler._TaskGraph(configs, strategy.bases())
+        self.assertEqual([graph.pop('a')[0], graph.pop('b')[0]], ['case_0', 'case_3'])
+
+        # successors are dispatched to the worker that ran the base case
+        graph.complete('case_3', 'done', {'entry': 'case_3'}, 'b')
+        graph.complete('case_0', 'done', {'entry': 'case_0'}, 'a')
+        self.assertEqual(len(graph), 2)
+        self.assertEqual(graph.pop('b')[0], 'case_4')
+        self.assertEqual(graph.pop()[0], 'case_1')
+        self.assertFalse(graph.ready)
+
+    def test_costs(self):
+        strategy = cw.Strategy.load({'sequence': {'foo': [1, 2, 3, 4]}})
+        configs = strategy.configurations({'foo': 0})
+        costs = {'case_0': 1., 'case_1': 1., 'case_2': 5., 'case_3': 2.}
+        graph = cw.handler._TaskGraph(configs, {}, costs=costs)
+        heads = []
+        while graph.ready:
+            heads.append(graph.pop()[0])
+        self.assertEqual(heads, ['case_2', 'case_3', 'case_0', 'case_1'])
+
+    def test_budget(self):
+        strategy = cw.Strategy.load({'sequence': {'foo': [1, 2, 3, 4]}})
+        configs = strategy.configurations({'foo': 0})
+        costs = {'case_0': 1., 'case_1': 1., 'case_2': 5., 'case_3': 2.}
+        graph = cw.handler._TaskGraph(configs, {}, costs=costs, budget=2., workers=2)
+        heads = []
+        while graph.ready:
+            heads.append(graph.pop()[0])
+        self.assertEqual(heads, ['case_3', 'case_0', 'case_1'])
+        self.assertEqual(graph.skipped, ['case_2'])
+
+    def test_deadline(self):
+        strategy = cw.Strategy.load({'sequence': {'foo': [1, 2, 3, 4]}})
+        configs = strategy.configurations({'foo': 0})
+
+        # without cost estimates, tasks are only limited by the deadline
+        graph = cw.handler._TaskGraph(configs, {}, budget=.05, workers=2)
+        self.assertEqual(graph.skipped, [])
+        self.assertEqual(len(graph), 4)
+        graph.pop()
+        time.sleep(.1)
+        self.assertFalse(graph.ready)
+        self.assertEqual(sorted(graph.expired), ['case_1', 'case_2', 'case_3'])
+
+    def test_unknown(self):
+        content = {'strategy': {'sequence': {'foo': [.01, .011, .012, .013, .014, .015]}},
+                   'defaults': {'foo': .01, 'bar': 1}, 'ctwrap': '0.3.0'}
+        sh = cw.SimulationHandler.from_dict(content)
+        sim = cw.Simulation.from_module(cw.modules.minimal)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            tasks = [task for task, _, _ in sh.as_completed(sim, number_of_processes=2, budget=.5)]
+        sh.close()
+        self.assertEqual(sorted(tasks), sorted(sh.tasks))
+        self.assertFalse([w for w in caught if 'budget' in str(w.message)])
+
+    def test_estimate(self):
+        info = {
+            'case_0': {'wall_time': 1., 'variation': {'foo': 1}},
+            'case_1': {'wall_time': 3., 'variation': {'foo': 3}},
+        }
+        variations = {'a': {'foo': 1}, 'b': {'foo': 2}, 'c': {'foo': 5}}
+        costs = cw.handler._estimate_cost(variations, info)
+        self.assertEqual(costs, {'a': 1., 'b': 2., 'c': 3.})
+        self.assertIsNone(cw.handler._estimate_cost(variations, {}))
+
+
 class TestMatrix(TestWrap):
 
     _strategy = 'matrix'